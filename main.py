@@ -12,14 +12,28 @@ import sys
 import asyncio
 import argparse
 import logging
-import yaml
 import json
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+# 可选：orjson 加速结果文件序列化，未安装时使用标准库json
+try:
+    import orjson
+    _ORJSON_SAVE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """结果文件中无法直接编码的对象：NumPy数组/数值转为列表或Python数值，其余转为字符串"""
+    tolist = getattr(obj, 'tolist', None)
+    return tolist() if tolist is not None else str(obj)
+
+
 # 添加项目路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from trading_bot.config.config_manager import load_config_cached
 from trading_bot.strategies.futures_trading_engine import FuturesTradingEngine
 from trading_bot.utils.risk_manager import SecurityChecker
 
@@ -54,8 +68,7 @@ class FuturesBot:
     async def _load_config(self):
         """加载配置文件"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+            self.config = load_config_cached(self.config_path)
         except Exception as e:
             raise Exception(f"加载配置文件失败: {e}")
 
@@ -236,8 +249,20 @@ class FuturesBot:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"{data_dir}/futures_analysis_{strategy_name}_{timestamp}.json"
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False, default=str)
+            payload = None
+            if orjson is not None:
+                # datetime、numpy数值在C层直接编码，default=str 仅处理其余未知类型
+                try:
+                    payload = orjson.dumps(result, default=_json_default, option=_ORJSON_SAVE_OPTIONS)
+                except orjson.JSONEncodeError as e:
+                    self.logger.debug(f"orjson序列化失败，回退到json: {e}")
+
+            if payload is not None:
+                with open(filename, 'wb') as f:
+                    f.write(payload)
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, indent=2, ensure_ascii=False, default=_json_default)
 
             self.logger.info(f"结果已保存到: {filename}")
         except Exception as e:
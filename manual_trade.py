@@ -37,11 +37,19 @@ import json
 import asyncio
 import argparse
 import logging
+import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+# 可选：orjson 加速决策文件解析与结果序列化，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from trading_bot.config.config_manager import load_config_cached
 from trading_bot.strategies.futures_trading_engine import FuturesTradingEngine
 
 
@@ -54,18 +62,38 @@ def setup_logging() -> logging.Logger:
     return logging.getLogger("manual_trade")
 
 
+# 全部合约最新价缓存：(过期时间, {symbol: price})
+_PRICE_CACHE: Tuple[float, Dict[str, float]] = (0.0, {})
+
+
+async def _all_prices_cached(client, ttl: float = 15) -> Dict[str, float]:
+    """一次请求获取全部合约最新价，ttl秒内复用，多笔决策共享同一份行情"""
+    global _PRICE_CACHE
+    expiry, prices = _PRICE_CACHE
+    now = time.monotonic()
+    if now < expiry:
+        return prices
+
+    tickers = await client.futures_symbol_ticker()
+    prices = {t['symbol']: float(t['price']) for t in tickers}
+    _PRICE_CACHE = (now + ttl, prices)
+    return prices
+
+
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # 以二进制读取，直接从字节解码（orjson可用时优先使用）
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 async def execute_manual_trade(config_path: str, decision_data: Dict[str, Any], do_execute: bool, dry_run_flag: bool):
     logger = logging.getLogger("manual_trade")
 
     # 1) 加载配置并初始化交易引擎
-    import yaml
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+    config = load_config_cached(config_path)
 
     binance_cfg = config.get('apis', {}).get('binance', {})
     deepseek_cfg = config.get('apis', {}).get('deepseek', {})
@@ -84,18 +112,26 @@ async def execute_manual_trade(config_path: str, decision_data: Dict[str, Any],
         take_profit_percent=position_cfg.get('take_profit_percent', 0.15)
     )
 
-    await engine.__aenter__()
+    symbol = str(decision_data.get('symbol', '')).upper()
+    if not symbol:
+        raise Exception('decision 缺少 symbol')
+
+    # 模拟模式且输入已给出entry_price时走离线路径：决策生成与模拟执行都不依赖网络，
+    # 无需建立Binance/DeepSeek会话
+    offline = dry_run_flag and bool(decision_data.get('entry_price'))
+    if not offline:
+        await engine.__aenter__()
     try:
         # 2) 读取当前市场数据（只取目标symbol当前价，避免访问账户等敏感接口）
-        symbol = str(decision_data.get('symbol', '')).upper()
-        if not symbol:
-            raise Exception('decision 缺少 symbol')
-
-        # 仅调用ticker获取最新价（无需账户权限）
-        ticker = await engine.futures_data_manager.client.futures_ticker(symbol=symbol)
-        current_price = float(ticker.get('lastPrice', 0))
-        if not current_price:
-            raise Exception(f'无法获取 {symbol} 当前价格')
+        if offline:
+            current_price = float(decision_data['entry_price'])
+            logger.info(f'离线模拟：以entry_price {current_price} 作为 {symbol} 当前价格')
+        else:
+            # 仅调用ticker获取最新价（无需账户权限）
+            prices = await _all_prices_cached(engine.futures_data_manager.client)
+            current_price = prices.get(symbol, 0.0)
+            if not current_price:
+                raise Exception(f'无法获取 {symbol} 当前价格')
 
         # 构造最小化的市场数据结构，足够生成决策
         sym_data = {
@@ -147,13 +183,19 @@ async def execute_manual_trade(config_path: str, decision_data: Dict[str, Any],
         ts = datetime.now().strftime('%Y%m%d_%H%M%S')
         os.makedirs('data', exist_ok=True)
         out_path = f'data/manual_trade_result_{symbol}_{ts}.json'
+        # 只序列化一次，同时用于保存与打印
+        if orjson is not None:
+            results_text = orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+        else:
+            results_text = json.dumps(results, indent=2, ensure_ascii=False)
         with open(out_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+            f.write(results_text)
         logger.info(f'执行结果已保存至: {out_path}')
-        print(json.dumps(results, indent=2, ensure_ascii=False))
+        print(results_text)
 
     finally:
-        await engine.__aexit__(None, None, None)
+        if not offline:
+            await engine.__aexit__(None, None, None)
 
 
 def parse_args():
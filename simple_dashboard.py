@@ -7,25 +7,202 @@
 import os
 import sys
 import json
+import argparse
 import logging
 from datetime import datetime
-from typing import Dict, List, Any
-from flask import Flask, render_template, jsonify
+from typing import Dict, List, Any, Optional, Tuple
+from flask import Flask, Response, render_template, jsonify, request
 import threading
 import time
 import re
+import asyncio
+import aiohttp
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import numpy as np
+
+from trading_bot.utils.indicators import rolling_mean, rolling_std
+
+# 可选：orjson 加速接口响应序列化，未安装时使用 Flask 的 jsonify
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 可选：Gunicorn 作为Web服务器，需通过 --gunicorn 显式启用，默认使用 Flask 自带服务器
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:
+    BaseApplication = None
 
 app = Flask(__name__)
 
+def ojsonify(obj: Any) -> Response:
+    """序列化为JSON响应，优先使用orjson"""
+    if orjson is None:
+        return jsonify(obj)
+    body = orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return Response(body, mimetype='application/json')
+
+# 历史文件条目分隔符：日志中分隔线长度为50/60/80个“=”，按最短的50个切分
+_ENTRY_SEP = b'=' * 50
+
+def _split_entries(data: bytes) -> List[bytes]:
+    """按连续50个及以上“=”切分字节内容，与 re.split(rb'={50,}') 一致（保留空片段）
+
+    “=”为单字节ASCII，不会出现在UTF-8多字节字符内部，可在解码前直接按字节切分。
+    """
+    parts = data.split(_ENTRY_SEP)
+    # 长分隔线切分后残留的“=”位于后续片段开头，一并去除
+    parts[1:] = [part.lstrip(b'=') for part in parts[1:]]
+    return parts
+
+def _decode_last_entries(parts: List[bytes], max_entries: int) -> List[str]:
+    """从末尾起只解码所需的条目，跳过空白条目，按原顺序返回"""
+    entries: List[str] = []
+    for part in reversed(parts):
+        text = part.decode('utf-8', errors='ignore').strip()
+        if text:
+            entries.append(text)
+            if len(entries) >= max_entries:
+                break
+    entries.reverse()
+    return entries
+
+# AI输出中 recommendations 数组的起始位置；数组本身交给JSON解码器解析
+_RECOMMENDATIONS_RE = re.compile(r'"recommendations"\s*:\s*\[')
+_JSON_DECODER = json.JSONDecoder()
+
+# 非模拟模式下获取行情使用的Binance U本位合约公开接口（无需API密钥）
+_FUTURES_TICKER_URL = "https://fapi.binance.com/fapi/v1/ticker/24hr"
+
+# 历史接口ETag前缀：区分不同进程，避免重启后写入次数重新计数导致误判304
+_ETAG_PREFIX = f"{os.getpid():x}{int(time.time()):x}"
+
+# 读取历史文件时的尾部窗口大小
+_TAIL_WINDOW = 256 * 1024
+
+# 模拟数据随机数池：启动时一次性生成，按递增计数循环取用（行数为2的幂，便于位与取模）
+_RAND_POOL_ROWS = 4096
+_RAND_POOL_MASK = _RAND_POOL_ROWS - 1
+_RAND_POOL_COLS = 9  # 一行足够生成一次完整的模拟行情（3个币种 × 3个随机字段）
+
+# 模拟账户数据中不随请求变化的字段
+_MOCK_BASE_BALANCE = 736.27
+_ACCOUNT_TEMPLATE = {
+    "available_balance": _MOCK_BASE_BALANCE * 0.7,
+}
+_POSITION_TEMPLATE = {
+    "symbol": "BTCUSDT",
+    "entryPrice": "115380.0",
+    "markPrice": "115500.0",
+}
+
+# 模拟行情参数：币种 -> (基准价, 价格波动, 涨跌幅波动, 成交量下限, 成交量上限, 高低价偏移)
+_MOCK_MARKET_SPECS = {
+    "BTCUSDT": (115500, 1000, 5, 100000, 200000, 1000),
+    "ETHUSDT": (4140, 100, 3, 3000000, 4000000, 100),
+    "SOLUSDT": (200, 10, 2, 20000000, 25000000, 10),
+}
+
+def ttl_cache(ttl: float):
+    """方法结果缓存装饰器：按方法名缓存在实例的 _ttl_cache 中，ttl秒内直接返回上次结果"""
+    def decorator(func):
+        name = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(self):
+            now = time.monotonic()
+            with self._ttl_lock:
+                entry = self._ttl_cache.get(name)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = func(self)
+            with self._ttl_lock:
+                self._ttl_cache[name] = (now + ttl, value)
+            return value
+        return wrapper
+    return decorator
+
+class HistoryRing:
+    """定长列式环形缓冲：每个字段一列float64，另有一列int64纳秒时间戳，仅在输出时生成字典
+
+    输出的数据点中 timestamp 为毫秒级Unix时间戳（整数），前端 new Date() 可直接解析。
+
+    rolling=(字段, 窗口) 时，输出的数据点附带该字段的滚动均值与标准差
+    （键名为 {字段}_ma{窗口} / {字段}_std{窗口}），基于缓冲区内全部历史计算。
+
+    lock 可由外部传入（需可重入），使多个缓冲区共用同一把锁以便整体原子更新。
+    """
+
+    def __init__(self, fields, capacity: int = 100, rolling: Optional[Tuple[str, int]] = None,
+                 lock: Optional[threading.RLock] = None):
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self.rolling = rolling
+        self._cols = np.full((len(self.fields), capacity), np.nan)
+        self._ts = np.zeros(capacity, dtype=np.int64)
+        self._head = 0
+        self._size = 0
+        self._lock = lock if lock is not None else threading.RLock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def version(self) -> int:
+        """累计写入次数，每写入一个数据点加1（可用作缓存校验标识）"""
+        return self._head
+
+    def append(self, ts_ns: int, values: Dict[str, Any]):
+        """写入一个数据点（ts_ns 为 time.time_ns()），缺失字段记为NaN"""
+        with self._lock:
+            i = self._head % self.capacity
+            self._ts[i] = ts_ns
+            for j, field in enumerate(self.fields):
+                value = values.get(field)
+                self._cols[j, i] = np.nan if value is None else value
+            self._head += 1
+            self._size = min(self._size + 1, self.capacity)
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """按时间顺序返回最近n个数据点"""
+        with self._lock:
+            idx = np.arange(self._head - self._size, self._head) % self.capacity
+            timestamps = (self._ts[idx] // 1_000_000).tolist()
+            cols = self._cols[:, idx]
+
+        fields = self.fields
+        if self.rolling is not None:
+            # 在完整历史上计算滚动指标，保证返回的最早数据点也有完整窗口
+            field, window = self.rolling
+            base = cols[fields.index(field)]
+            cols = np.vstack([cols, rolling_mean(base, window), rolling_std(base, window)])
+            fields = fields + (f"{field}_ma{window}", f"{field}_std{window}")
+
+        n = min(n, len(timestamps))
+        points = []
+        for ts, row in zip(timestamps[len(timestamps) - n:], cols[:, cols.shape[1] - n:].T.tolist()):
+            point = {"timestamp": ts}
+            for field, value in zip(fields, row):
+                if value == value:  # 跳过NaN（该点缺失的字段或窗口未满）
+                    point[field] = value
+            points.append(point)
+        return points
+
 class SimpleTradingDashboard:
     """简化版交易监控面板"""
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-        # 历史数据缓存
-        self.price_history = []
-        self.pnl_history = []
+        # 历史数据缓存：价格与盈亏共用一把锁，同一周期的两个数据点一起写入
+        self._lock = threading.RLock()
+        self.price_history = HistoryRing(_MOCK_MARKET_SPECS, capacity=100, lock=self._lock)
+        self.pnl_history = HistoryRing(("total_balance", "unrealized_pnl", "total_position_pnl"),
+                                       capacity=100, rolling=("total_balance", 20), lock=self._lock)
 
         # 文件路径
         self.history_file = "/home/xiaoqibpnm/bitbot/history.txt"
@@ -36,96 +213,117 @@ class SimpleTradingDashboard:
 
         # 模拟数据
         self.mock_data_enabled = True
+        # [-1, 1)均匀分布随机数，每行供一次模拟数据生成使用
+        self._rand_pool = np.random.default_rng().uniform(-1, 1, size=(_RAND_POOL_ROWS, _RAND_POOL_COLS))
+        self._rand_idx = itertools.count()
+
+        # 历史文件并行读取线程池
+        self._io_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='dashboard-io')
+
+        # 历史文件读取缓存：{路径: ((mtime_ns, size, max_entries), 条目列表)}
+        self._file_cache: Dict[str, Any] = {}
+
+        # 接口数据TTL缓存：{方法名: (过期时间, 结果)}
+        self._ttl_cache: Dict[str, Any] = {}
+        self._ttl_lock = threading.Lock()
+
+    def invalidate_cache(self):
+        """清空接口数据缓存"""
+        with self._ttl_lock:
+            self._ttl_cache.clear()
 
+    def _next_rand_row(self) -> np.ndarray:
+        """从随机数池中取下一行"""
+        return self._rand_pool[next(self._rand_idx) & _RAND_POOL_MASK]
+
+    @ttl_cache(15)
     def get_mock_account_data(self) -> Dict[str, Any]:
         """获取模拟账户数据"""
-        import random
-        base_balance = 736.27
-        pnl = random.uniform(-50, 100)
+        pnl = float(self._next_rand_row()[0]) * 75 + 25  # [-50, 100)
+        has_position = abs(pnl) > 10
 
         return {
-            "total_balance": base_balance + pnl,
+            **_ACCOUNT_TEMPLATE,
+            "total_balance": _MOCK_BASE_BALANCE + pnl,
             "unrealized_pnl": pnl,
-            "available_balance": base_balance * 0.7,
             "total_position_value": abs(pnl) * 10,
             "total_position_pnl": pnl,
-            "position_count": 1 if abs(pnl) > 10 else 0,
+            "position_count": 1 if has_position else 0,
             "positions": [{
-                "symbol": "BTCUSDT",
+                **_POSITION_TEMPLATE,
                 "positionAmt": "0.020000" if pnl > 0 else "-0.020000",
-                "entryPrice": "115380.0",
-                "markPrice": "115500.0",
                 "unRealizedProfit": str(pnl)
-            }] if abs(pnl) > 10 else [],
+            }] if has_position else [],
             "timestamp": datetime.now().isoformat()
         }
 
+    @ttl_cache(15)
     def get_mock_market_data(self) -> Dict[str, Any]:
         """获取模拟市场数据"""
-        import random
-
-        btc_base = 115500
-        eth_base = 4140
-        sol_base = 200
-
-        return {
-            "BTCUSDT": {
-                "price": btc_base + random.uniform(-1000, 1000),
-                "change_24h": random.uniform(-5, 5),
-                "volume_24h": random.uniform(100000, 200000),
-                "high_24h": btc_base + 1000,
-                "low_24h": btc_base - 1000
-            },
-            "ETHUSDT": {
-                "price": eth_base + random.uniform(-100, 100),
-                "change_24h": random.uniform(-3, 3),
-                "volume_24h": random.uniform(3000000, 4000000),
-                "high_24h": eth_base + 100,
-                "low_24h": eth_base - 100
-            },
-            "SOLUSDT": {
-                "price": sol_base + random.uniform(-10, 10),
-                "change_24h": random.uniform(-2, 2),
-                "volume_24h": random.uniform(20000000, 25000000),
-                "high_24h": sol_base + 10,
-                "low_24h": sol_base - 10
+        row = self._next_rand_row()
+        market_data = {}
+
+        for i, (symbol, spec) in enumerate(_MOCK_MARKET_SPECS.items()):
+            base, price_spread, change_spread, vol_lo, vol_hi, hilo = spec
+            r_price, r_change, r_volume = row[3 * i:3 * i + 3].tolist()
+            market_data[symbol] = {
+                "price": base + r_price * price_spread,
+                "change_24h": r_change * change_spread,
+                "volume_24h": (vol_lo + vol_hi) / 2 + r_volume * (vol_hi - vol_lo) / 2,
+                "high_24h": base + hilo,
+                "low_24h": base - hilo
             }
-        }
+
+        return market_data
 
     def read_file_content(self, file_path: str, max_entries: int = 2) -> List[str]:
-        """读取文件内容，返回最近的条目"""
+        """读取文件内容，返回最近的条目（只读取文件尾部，按mtime与大小缓存）"""
         try:
-            if not os.path.exists(file_path):
-                return []
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-
-            if not content:
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 return []
 
-            # 按分隔符分割条目
-            entries = re.split(r'={50,}', content)
-            entries = [entry.strip() for entry in entries if entry.strip()]
+            key = (st.st_mtime_ns, st.st_size, max_entries)
+            cached = self._file_cache.get(file_path)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+            size = st.st_size
+            window = min(size, _TAIL_WINDOW)
+            with open(file_path, 'rb') as f:
+                while True:
+                    f.seek(size - window)
+                    # 按分隔符切分字节内容，只解码最近的条目
+                    parts = _split_entries(f.read(window))
+                    if window < size:
+                        # 窗口不是从文件开头读取时，第一个片段可能不完整，丢弃
+                        parts = parts[1:]
+                    entries = _decode_last_entries(parts, max_entries)
+                    # 条目不足时扩大窗口重读
+                    if window >= size or len(entries) >= max_entries:
+                        break
+                    window = min(size, window * 2)
 
             # 返回最近的条目
-            return entries[-max_entries:] if entries else []
+            result = entries
+            self._file_cache[file_path] = (key, result)
+            return result
 
         except Exception as e:
             self.logger.error(f"读取文件{file_path}失败: {e}")
             return []
 
+    @ttl_cache(15)
     def get_ai_content(self) -> Dict[str, Any]:
         """获取AI相关内容"""
         try:
-            # 读取AI输出内容（最近2条）
-            output_content = self.read_file_content(self.output_file, 2)
-
-            # 读取AI输入内容（最近2条）
-            input_content = self.read_file_content(self.input_file, 2)
-
-            # 读取AI思考内容（最近2条）
-            think_content = self.read_file_content(self.think_file, 2)
+            # 并行读取AI输出、输入、思考内容（各最近2条），三个文件互不依赖
+            futures = [
+                self._io_pool.submit(self.read_file_content, path, 2)
+                for path in (self.output_file, self.input_file, self.think_file)
+            ]
+            output_content, input_content, think_content = [f.result() for f in futures]
 
             # 解析最新的AI决策
             latest_decisions = []
@@ -134,12 +332,10 @@ class SimpleTradingDashboard:
                     # 从输出内容中提取交易决策
                     latest_output = output_content[-1]
 
-                    # 查找JSON部分
-                    json_match = re.search(r'\\{.*?"recommendations".*?\\}', latest_output, re.DOTALL)
-                    if json_match:
-                        json_str = json_match.group(0)
-                        parsed_data = json.loads(json_str)
-                        latest_decisions = parsed_data.get('recommendations', [])
+                    # 定位recommendations数组并直接解码（线性扫描，无回溯）
+                    rec_match = _RECOMMENDATIONS_RE.search(latest_output)
+                    if rec_match:
+                        latest_decisions, _ = _JSON_DECODER.raw_decode(latest_output, rec_match.end() - 1)
                 except Exception as e:
                     self.logger.warning(f"解析AI决策失败: {e}")
 
@@ -166,46 +362,64 @@ class SimpleTradingDashboard:
             self.logger.error(f"获取AI内容失败: {e}")
             return {"error": str(e)}
 
-    def update_history_data(self):
+    async def fetch_ticker(self, session: aiohttp.ClientSession, symbol: str) -> Dict[str, Any]:
+        """获取单个币种的24小时行情"""
+        try:
+            async with session.get(_FUTURES_TICKER_URL, params={"symbol": symbol}) as resp:
+                resp.raise_for_status()
+                ticker = await resp.json()
+            return {
+                "price": float(ticker.get("lastPrice", 0)),
+                "change_24h": float(ticker.get("priceChangePercent", 0)),
+                "volume_24h": float(ticker.get("volume", 0)),
+                "high_24h": float(ticker.get("highPrice", 0)),
+                "low_24h": float(ticker.get("lowPrice", 0))
+            }
+        except Exception as e:
+            self.logger.error(f"获取{symbol}行情失败: {e}")
+            return {"error": str(e)}
+
+    async def fetch_market_data(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        """并发获取所有币种行情，总耗时取决于最慢的一个请求"""
+        symbols = list(_MOCK_MARKET_SPECS)
+        tickers = await asyncio.gather(*(self.fetch_ticker(session, symbol) for symbol in symbols))
+        return dict(zip(symbols, tickers))
+
+    async def update_history_data(self, session: aiohttp.ClientSession):
         """更新历史数据"""
         try:
-            timestamp = datetime.now()
+            ts_ns = time.time_ns()
 
             # 获取当前数据
             if self.mock_data_enabled:
                 account_data = self.get_mock_account_data()
                 market_data = self.get_mock_market_data()
             else:
-                # 这里可以集成真实的API调用
+                # 账户数据需要API密钥，这里暂不接入；行情使用公开接口
                 account_data = {"unrealized_pnl": 0}
-                market_data = {}
-
-            # 更新盈亏历史
-            if "error" not in account_data:
-                pnl_point = {
-                    "timestamp": timestamp.isoformat(),
-                    "total_balance": account_data.get("total_balance", 0),
-                    "unrealized_pnl": account_data.get("unrealized_pnl", 0),
-                    "total_position_pnl": account_data.get("total_position_pnl", 0)
-                }
-                self.pnl_history.append(pnl_point)
-
-            # 更新价格历史
-            if market_data:
-                price_point = {"timestamp": timestamp.isoformat()}
-                for symbol, data in market_data.items():
-                    if "error" not in data:
-                        price_point[symbol] = data.get("price", 0)
-                self.price_history.append(price_point)
-
-            # 保持最近100个数据点
-            if len(self.pnl_history) > 100:
-                self.pnl_history = self.pnl_history[-100:]
-            if len(self.price_history) > 100:
-                self.price_history = self.price_history[-100:]
+                market_data = await self.fetch_market_data(session)
+
+            # 持锁写入，读取方不会看到只更新了一半的周期数据
+            with self._lock:
+                # 更新盈亏历史（环形缓冲保持最近100个数据点）
+                if "error" not in account_data:
+                    self.pnl_history.append(ts_ns, {
+                        "total_balance": account_data.get("total_balance", 0),
+                        "unrealized_pnl": account_data.get("unrealized_pnl", 0),
+                        "total_position_pnl": account_data.get("total_position_pnl", 0)
+                    })
+
+                # 更新价格历史
+                if market_data:
+                    self.price_history.append(ts_ns, {
+                        symbol: data.get("price", 0)
+                        for symbol, data in market_data.items() if "error" not in data
+                    })
 
         except Exception as e:
             self.logger.error(f"更新历史数据失败: {e}")
+        finally:
+            self.invalidate_cache()
 
 # 全局实例
 dashboard = SimpleTradingDashboard()
@@ -219,52 +433,107 @@ def index():
 def api_account():
     """账户信息API"""
     if dashboard.mock_data_enabled:
-        return jsonify(dashboard.get_mock_account_data())
+        return ojsonify(dashboard.get_mock_account_data())
     else:
         # 这里可以添加真实API调用
-        return jsonify({"error": "真实API未配置"})
+        return ojsonify({"error": "真实API未配置"})
 
 @app.route('/api/market')
 def api_market():
     """市场数据API"""
     if dashboard.mock_data_enabled:
-        return jsonify(dashboard.get_mock_market_data())
+        return ojsonify(dashboard.get_mock_market_data())
     else:
         # 这里可以添加真实API调用
-        return jsonify({"error": "真实API未配置"})
+        return ojsonify({"error": "真实API未配置"})
 
 @app.route('/api/ai_content')
 def api_ai_content():
     """AI内容API"""
-    return jsonify(dashboard.get_ai_content())
+    return ojsonify(dashboard.get_ai_content())
+
+def history_response(ring: HistoryRing, n: int = 50) -> Response:
+    """历史数据响应：以写入次数生成ETag，客户端数据未过期时返回304"""
+    etag = f"{_ETAG_PREFIX}-{ring.version}"
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+    else:
+        resp = ojsonify(ring.tail(n))
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'public, max-age=15'
+    return resp
 
 @app.route('/api/history/prices')
 def api_price_history():
     """价格历史API"""
-    return jsonify(dashboard.price_history[-50:])  # 最近50个数据点
+    return history_response(dashboard.price_history, 50)  # 最近50个数据点
 
 @app.route('/api/history/pnl')
 def api_pnl_history():
     """盈亏历史API"""
-    return jsonify(dashboard.pnl_history[-50:])  # 最近50个数据点
+    return history_response(dashboard.pnl_history, 50)  # 最近50个数据点
+
+async def background_update_async():
+    """异步后台数据更新任务，整个生命周期共用一个HTTP会话（keep-alive连接复用）"""
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        while True:
+            try:
+                await dashboard.update_history_data(session)
+                await asyncio.sleep(30)  # 每30秒更新一次
+            except Exception as e:
+                dashboard.logger.error(f"后台更新失败: {e}")
+                await asyncio.sleep(60)
 
 def background_update():
-    """后台数据更新任务"""
-    while True:
-        try:
-            dashboard.update_history_data()
-            time.sleep(30)  # 每30秒更新一次
-        except Exception as e:
-            dashboard.logger.error(f"后台更新失败: {e}")
-            time.sleep(60)
+    """后台数据更新线程入口：在本线程中运行事件循环"""
+    asyncio.run(background_update_async())
+
+def start_background_update(worker=None):
+    """启动后台更新线程（Gunicorn下在worker进程fork后调用）"""
+    update_thread = threading.Thread(target=background_update, daemon=True)
+    update_thread.start()
 
-def main():
+if BaseApplication is not None:
+    class DashboardApplication(BaseApplication):
+        """以编程方式启动的Gunicorn应用"""
+
+        def __init__(self, application, options: Dict[str, Any] = None):
+            self.options = options or {}
+            self.application = application
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key.lower(), value)
+
+        def load(self):
+            return self.application
+
+def run_gunicorn():
+    """通过Gunicorn运行Web服务
+
+    历史数据保存在进程内的全局 dashboard 中，多个worker会各自维护一份不同的数据，
+    因此只使用单个worker，由线程处理并发请求。
+    """
+    options = {
+        'bind': '0.0.0.0:5000',
+        'workers': 1,
+        'worker_class': 'gthread',
+        'threads': 8,
+        'keepalive': 75,
+        'post_worker_init': start_background_update,
+    }
+    DashboardApplication(app, options).run()
+
+def main(use_gunicorn: bool = False):
     """主函数"""
     print("🚀 启动简化版交易监控面板...")
 
-    # 启动后台更新线程
-    update_thread = threading.Thread(target=background_update, daemon=True)
-    update_thread.start()
+    # 启动后台更新线程（Gunicorn下由worker进程启动）
+    if not use_gunicorn:
+        start_background_update()
 
     print("✅ 交易监控面板启动成功！")
     print("🌐 访问地址: http://localhost:5000")
@@ -280,8 +549,17 @@ def main():
     print("🔄 按Ctrl+C停止服务")
     print("")
 
-    # 启动Flask应用
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    # 启动Web服务
+    if use_gunicorn:
+        run_gunicorn()
+    else:
+        app.run(host='0.0.0.0', port=5000, debug=False)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='简化版交易监控面板')
+    parser.add_argument('--gunicorn', action='store_true',
+                        help='使用Gunicorn(gthread)作为Web服务器（需已安装gunicorn）')
+    args = parser.parse_args()
+    if args.gunicorn and BaseApplication is None:
+        parser.error("未安装gunicorn，请先执行: pip install gunicorn")
+    main(args.gunicorn)
\ No newline at end of file
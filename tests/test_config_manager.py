@@ -0,0 +1,55 @@
+"""
+配置加载测试：JSON旁路缓存的冷/热加载一致性与缓存写入失败的容错
+"""
+
+import os
+
+import pytest
+
+from trading_bot.config import config_manager
+from trading_bot.config.config_manager import load_config_cached
+
+
+@pytest.fixture(autouse=True)
+def _clear_memo():
+    config_manager._CONFIG_MEMO.clear()
+    yield
+    config_manager._CONFIG_MEMO.clear()
+
+
+def _write_yaml(tmp_path, text: str) -> str:
+    path = tmp_path / "config.yaml"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_cold_and_warm_loads_return_same_types(tmp_path):
+    path = _write_yaml(tmp_path, "d: 2024-01-01\nn:\n  1: x\nsymbols: [BTCUSDT]\n")
+
+    cold = load_config_cached(path)
+    assert os.path.exists(path + ".cache.json")
+
+    config_manager._CONFIG_MEMO.clear()  # 模拟新进程，从旁路缓存加载
+    warm = load_config_cached(path)
+
+    assert cold == warm == {'d': '2024-01-01', 'n': {'1': 'x'}, 'symbols': ['BTCUSDT']}
+
+
+def test_unencodable_config_loads_without_sidecar(tmp_path):
+    path = _write_yaml(tmp_path, "2024-01-01: a\nkey: value\n")
+
+    config = load_config_cached(path)
+
+    assert config['key'] == 'value'
+    assert sorted(os.listdir(tmp_path)) == ["config.yaml"]  # 不写缓存，也不留临时文件
+
+
+def test_callers_get_independent_copies(tmp_path):
+    path = _write_yaml(tmp_path, "trading:\n  symbols: [BTCUSDT, ETHUSDT]\n")
+
+    first = load_config_cached(path)
+    first['trading']['symbols'].append('SOLUSDT')
+    second = load_config_cached(path)  # 命中进程内缓存
+    second['trading']['symbols'].clear()
+
+    assert load_config_cached(path)['trading']['symbols'] == ['BTCUSDT', 'ETHUSDT']
@@ -0,0 +1,47 @@
+"""
+历史记录序列化测试：模型输入中的NumPy K线列在orjson与标准库json两条路径下均可写出
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from trading_bot.utils import enhanced_history_logger
+
+
+def _model_input() -> dict:
+    return {
+        'multi_timeframe_data': {
+            '1h': {
+                'columns': {
+                    'open_time': np.arange(3, dtype=np.int64),
+                    'close': np.array([1.5, 2.5, 3.5]),
+                    'reversed': np.arange(4.0)[::-1],  # 非连续数组
+                },
+                'count': np.int64(3),
+            }
+        },
+        'current_price': np.float64(3.5),
+    }
+
+
+EXPECTED = {
+    'multi_timeframe_data': {
+        '1h': {
+            'columns': {'open_time': [0, 1, 2], 'close': [1.5, 2.5, 3.5], 'reversed': [3.0, 2.0, 1.0, 0.0]},
+            'count': 3,
+        }
+    },
+    'current_price': 3.5,
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_pretty_encodes_numpy_values(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(enhanced_history_logger, 'orjson', None)
+    elif enhanced_history_logger.orjson is None:
+        pytest.skip("未安装orjson")
+
+    assert json.loads(enhanced_history_logger._dumps_pretty(_model_input())) == EXPECTED
@@ -0,0 +1,130 @@
+"""
+期货数据管理器测试：技术指标与原 pandas 实现的计算结果对比
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.data.futures_data import FuturesDataManager
+
+
+def _klines_columns(n: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, n))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0.0, 0.003, (2, n)))
+    return {
+        'open_time': 1_600_000_000_000 + np.arange(n, dtype=np.int64) * 3_600_000,
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + spread[0]),
+        'low': np.minimum(open_, close) * (1 - spread[1]),
+        'close': close,
+        'volume': np.abs(rng.normal(1000.0, 300.0, n)),
+    }
+
+
+def _pandas_reference(columns: dict) -> dict:
+    """按原 DataFrame 实现计算最新一根K线的指标"""
+    df = pd.DataFrame(columns)
+    close, high, low = df['close'], df['high'], df['low']
+
+    ema_12 = close.ewm(span=12).mean()
+    ema_26 = close.ewm(span=26).mean()
+    macd = ema_12 - ema_26
+    macd_signal = macd.ewm(span=9).mean()
+
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+
+    bb_middle = close.rolling(window=20).mean()
+    bb_std = close.rolling(window=20).std()
+
+    prev_close = close.shift()
+    tr = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
+    returns = close.pct_change()
+
+    expected = {
+        'sma_7': close.rolling(window=7).mean().iloc[-1],
+        'sma_20': bb_middle.iloc[-1],
+        'sma_50': close.rolling(window=50).mean().iloc[-1],
+        'ema_12': ema_12.iloc[-1],
+        'ema_26': ema_26.iloc[-1],
+        'ema_50': close.ewm(span=50).mean().iloc[-1],
+        'rsi': (100 - 100 / (1 + gain / loss)).iloc[-1],
+        'macd': macd.iloc[-1],
+        'macd_signal': macd_signal.iloc[-1],
+        'macd_histogram': (macd - macd_signal).iloc[-1],
+        'bb_upper': (bb_middle + bb_std * 2).iloc[-1],
+        'bb_lower': (bb_middle - bb_std * 2).iloc[-1],
+        'atr': tr.rolling(window=14).mean().iloc[-1],
+        'volume_sma': df['volume'].rolling(window=20).mean().iloc[-1],
+    }
+    if len(df) >= 200:
+        expected['sma_200'] = close.rolling(window=200).mean().iloc[-1]
+    if len(df) > 168:
+        expected['volatility_7d'] = returns.rolling(window=168).std().iloc[-1] * np.sqrt(24) * 100
+    if len(df) > 720:
+        expected['volatility_30d'] = returns.rolling(window=720).std().iloc[-1] * np.sqrt(24) * 100
+    return expected
+
+
+@pytest.mark.parametrize("n", [50, 51, 169, 200, 721, 1000])
+def test_advanced_indicators_match_pandas(n):
+    columns = _klines_columns(n, seed=n)
+    indicators = asyncio.run(FuturesDataManager().calculate_advanced_indicators(columns, "1h"))
+
+    for key, value in _pandas_reference(columns).items():
+        assert indicators[key] == pytest.approx(value, rel=1e-9), key
+    assert (indicators['sma_200'] is None) == (n < 200)
+    assert (indicators['volatility_7d'] is None) == (n <= 168)
+    assert (indicators['volatility_30d'] is None) == (n <= 720)
+
+
+def test_advanced_indicators_require_50_klines():
+    columns = _klines_columns(49)
+    assert asyncio.run(FuturesDataManager().calculate_advanced_indicators(columns, "1h")) == {}
+
+
+class _KlinesClient:
+    """返回固定原始K线行的客户端"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def futures_klines(self, symbol, interval, limit):
+        return self.rows
+
+
+def test_timeframe_klines_parsed_into_columns():
+    rows = [
+        [1_600_000_000_000 + i * 60_000, f"{100 + i}.5", f"{101 + i}.25", f"{99 + i}.75", f"{100 + i}.125",
+         f"{10 + i}.5", 1_600_000_059_999 + i * 60_000, f"{1000 + i}.5", 42 + i, f"{5 + i}.25", f"{500 + i}.75", "0"]
+        for i in range(3)
+    ]
+    manager = FuturesDataManager()
+    manager.client = _KlinesClient(rows)
+    result = asyncio.run(manager._get_timeframe_klines("BTCUSDT", "1m"))
+
+    assert result['count'] == 3
+    assert result['description'] == manager.timeframes["1m"]['description']
+    columns = result['columns']
+    assert columns['open_time'].dtype == np.int64 and columns['number_of_trades'].dtype == np.int64
+    assert columns['close'].dtype == np.float64 and columns['close'].flags['C_CONTIGUOUS']
+    for i, row in enumerate(rows):
+        assert [columns[name][i].item() for name in columns] == [
+            float(value) if isinstance(value, str) else value for value in row[:len(columns)]
+        ]
+
+
+def test_timeframe_klines_failure_returns_error():
+    class _FailingClient:
+        async def futures_klines(self, symbol, interval, limit):
+            raise asyncio.TimeoutError()
+
+    manager = FuturesDataManager()
+    manager.client = _FailingClient()
+    assert 'error' in asyncio.run(manager._get_timeframe_klines("BTCUSDT", "1h"))
@@ -0,0 +1,94 @@
+"""
+滚动指标计算模块测试：与 pandas 的计算结果逐点对比
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.utils.indicators import ewm_last, ewm_mean, rolling_mean, rolling_std
+
+
+def _random_walk(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, n))
+
+
+@pytest.mark.parametrize("n", [1, 19, 20, 21, 500, 5000])
+@pytest.mark.parametrize("window", [1, 2, 14, 20, 168])
+def test_rolling_mean_matches_pandas(n, window):
+    x = _random_walk(n)
+    expected = pd.Series(x).rolling(window).mean().to_numpy()
+    np.testing.assert_allclose(rolling_mean(x, window), expected, rtol=1e-12, atol=0, equal_nan=True)
+
+
+@pytest.mark.parametrize("n", [2, 19, 20, 21, 500, 5000])
+@pytest.mark.parametrize("window", [2, 14, 20, 168])
+def test_rolling_std_matches_pandas(n, window):
+    x = _random_walk(n)
+    expected = pd.Series(x).rolling(window).std().to_numpy()
+    np.testing.assert_allclose(rolling_std(x, window), expected, rtol=1e-9, atol=0, equal_nan=True)
+
+
+def test_rolling_shorter_than_window_is_all_nan():
+    x = _random_walk(10)
+    assert np.isnan(rolling_mean(x, 20)).all()
+    assert np.isnan(rolling_std(x, 20)).all()
+    assert len(rolling_mean(np.array([]), 20)) == 0
+
+
+def test_rolling_flat_input():
+    x = np.full(50, 1234.5)
+    mean = rolling_mean(x, 20)
+    std = rolling_std(x, 20)
+    assert np.isnan(mean[:19]).all() and np.isnan(std[:19]).all()
+    np.testing.assert_array_equal(mean[19:], 1234.5)
+    np.testing.assert_array_equal(std[19:], 0.0)
+
+
+def test_rolling_std_unaffected_by_large_values_outside_window():
+    # 窗口外的大数值不应吞掉窗口内的小波动
+    rng = np.random.default_rng(1)
+    x = np.concatenate([np.full(500, 1e8), 1.0 + rng.normal(0.0, 0.006, 20)])
+    expected = pd.Series(x).rolling(20).std().to_numpy()
+    result = rolling_std(x, 20)
+    assert result[-1] > 0.001
+    np.testing.assert_allclose(result[-1], expected[-1], rtol=1e-9)
+    np.testing.assert_allclose(rolling_mean(x, 20)[-1], pd.Series(x).rolling(20).mean().iloc[-1], rtol=1e-12)
+
+
+def test_rolling_writes_into_preallocated_out():
+    x = _random_walk(100)
+    out = np.empty(100)
+    assert rolling_std(x, 20, out=out) is out
+    np.testing.assert_allclose(out, pd.Series(x).rolling(20).std().to_numpy(), rtol=1e-9, equal_nan=True)
+    with pytest.raises(ValueError):
+        rolling_mean(x, 20, out=np.empty(99))
+
+
+def test_rolling_rejects_invalid_window():
+    x = _random_walk(10)
+    with pytest.raises(ValueError):
+        rolling_mean(x, 0)
+    with pytest.raises(ValueError):
+        rolling_std(x, 1)
+
+
+@pytest.mark.parametrize("span", [9, 12, 26, 50])
+@pytest.mark.parametrize("n_kind", ["1", "span-1", "span", "1000", "5000"])
+def test_ewm_matches_pandas(span, n_kind):
+    n = {"1": 1, "span-1": span - 1, "span": span}.get(n_kind) or int(n_kind)
+    x = _random_walk(n, seed=span)
+    expected = pd.Series(x).ewm(span=span).mean().to_numpy()
+    np.testing.assert_allclose(ewm_mean(x, span), expected, rtol=1e-12, atol=0)
+    np.testing.assert_allclose(ewm_last(x, span), expected[-1], rtol=1e-12, atol=0)
+
+
+def test_ewm_edge_cases():
+    assert len(ewm_mean(np.array([]), 12)) == 0
+    assert np.isnan(ewm_last(np.array([]), 12))
+    x = _random_walk(30)
+    np.testing.assert_array_equal(ewm_mean(x, 1), x)  # span=1 时不做平滑
+    np.testing.assert_allclose(ewm_mean(np.full(100, 7.5), 26), 7.5, rtol=1e-15)
+    with pytest.raises(ValueError):
+        ewm_mean(x, 0.5)
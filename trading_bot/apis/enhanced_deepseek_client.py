@@ -5,6 +5,7 @@
 
 import asyncio
 import aiohttp
+import hashlib
 import json
 import logging
 import time
@@ -12,168 +13,58 @@ import re
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
-# Import enhanced history logger
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.enhanced_history_logger import EnhancedHistoryLogger
-
-
-class EnhancedDeepSeekClient:
-    """增强版DeepSeek API客户端"""
-
-    def __init__(self, api_key: str, base_url: str = "https://api.deepseek.com"):
-        self.api_key = api_key
-        self.base_url = base_url
-        self.session = None
-        self.logger = logging.getLogger(__name__)
-        self.enhanced_history_logger = EnhancedHistoryLogger()
-
-    async def __aenter__(self):
-        """异步上下文管理器入口"""
-        self.session = aiohttp.ClientSession(
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-        )
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """异步上下文管理器出口"""
-        if self.session:
-            await self.session.close()
-
-    async def analyze_comprehensive_market_data(
-        self,
-        futures_data: Dict[str, Any],
-        user_prompt: str,
-        symbols: List[str] = ["BTC", "ETH", "SOL"],
-        focus_timeframes: List[str] = ["1m", "15m", "1h", "1d", "1M"]
-    ) -> Dict[str, Any]:
-        """
-        分析全面的期货市场数据
-
-        Args:
-            futures_data: 期货市场数据
-            user_prompt: 用户策略提示
-            symbols: 要分析的币种
-            focus_timeframes: 重点分析的时间周期
-
-        Returns:
-            详细的分析结果
-        """
-        try:
-            start_time = time.time()
-
-            system_prompt = self._build_enhanced_system_prompt()
-            analysis_prompt = self._build_comprehensive_analysis_prompt(
-                futures_data, user_prompt, symbols, focus_timeframes
-            )
-
-            # 记录AI完整输入数据到 history/input.txt
-            await self.enhanced_history_logger.log_ai_input(
-                system_prompt=system_prompt,
-                user_prompt=analysis_prompt,
-                analysis_context={
-                    "prompt_type": "comprehensive_futures_analysis",
-                    "symbols": symbols,
-                    "focus_timeframes": focus_timeframes,
-                    "analysis_type": "futures_comprehensive",
-                    "user_strategy": user_prompt,
-                    "timestamp": datetime.now().isoformat()
-                }
-            )
-
-            # 记录模型输入到原有文件（保持兼容性）
-            await self.enhanced_history_logger.log_model_input(
-                prompt_type="comprehensive_futures_analysis",
-                user_prompt=user_prompt,
-                system_prompt=system_prompt,
-                market_data=futures_data,
-                symbols=symbols,
-                additional_context={
-                    "focus_timeframes": focus_timeframes,
-                    "analysis_type": "futures_comprehensive"
-                }
-            )
-
-            response = await self._call_api(system_prompt, analysis_prompt)
-            result = self._parse_enhanced_analysis_response(response)
-
-            processing_time = time.time() - start_time
-
-            # 提取AI思考过程并记录到 think.txt（优先使用 reasoning_content 字段）
-            reasoning_content = result.get('reasoning_content') or self._extract_reasoning_content_from_response(response)
-            thinking_process = reasoning_content or self._extract_thinking_process(response)
-            if not thinking_process:
-                raw_content = self._get_response_content(response)
-                thinking_process = self._build_fallback_thinking(raw_content, result)
-            cleaned_thinking = self._clean_reasoning_text(thinking_process)
-
-            # 从user_prompt中提取session信息
-            session_info = self._extract_session_info(user_prompt)
-
-            # 生成市场摘要
-            market_summary = self._generate_market_summary(futures_data, symbols)
-
-            # 提取最终决策
-            final_decision = self._extract_final_decision(result)
-
-            await self.enhanced_history_logger.log_ai_thinking(
-                session_info=session_info,
-                market_summary=market_summary,
-                reasoning_process=cleaned_thinking,
-                final_decision=final_decision
-            )
-
-            # 记录AI完整输出数据到 history/output.txt
-            await self.enhanced_history_logger.log_ai_output(
-                raw_response=response,
-                parsed_result=result,
-                processing_time=processing_time,
-                error_info=result.get('error') if 'error' in result else None
-            )
-
-            # 记录模型输出到原有文件（保持兼容性）
-            await self.enhanced_history_logger.log_model_output(
-                output_type="comprehensive_futures_analysis_result",
-                model_response=result,
-                processing_time=processing_time,
-                symbols=symbols
-            )
-
-            return result
-
-        except Exception as e:
-            self.logger.error(f"分析全面市场数据时出错: {e}")
-
-            error_result = {"error": str(e), "recommendations": []}
-
-            # 记录错误输出到 history/output.txt
-            await self.enhanced_history_logger.log_ai_output(
-                raw_response={"error": str(e)},
-                parsed_result=error_result,
-                processing_time=time.time() - start_time if 'start_time' in locals() else None,
-                error_info=str(e)
-            )
-
-            # 记录错误到原有文件（保持兼容性）
-            await self.enhanced_history_logger.log_error(
-                error_type="deepseek_analysis_error",
-                error_message=str(e),
-                context={
-                    "symbols": symbols,
-                    "user_prompt": user_prompt,
-                    "focus_timeframes": focus_timeframes
-                }
-            )
-
-            return error_result
-
-    def _build_enhanced_system_prompt(self) -> str:
-        """构建增强版系统提示"""
-        return """🤖 你是一个自主交易AI，负责基于数据给出可直接执行的交易指令。
+from trading_bot.utils.enhanced_history_logger import EnhancedHistoryLogger
+
+# 可选：orjson 加速请求体序列化与响应解析，未安装时使用标准库json
+try:
+    import orjson
+    _json_dumps_bytes = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# 请求体模板：固定字段预先序列化，每次只需转义两段提示词
+# temperature 0.2 降低温度以获得更一致的分析；max_tokens 4000 支持更详细的分析
+_PAYLOAD_TEMPLATE = (
+    b'{"model":"deepseek-reasoner","messages":['
+    b'{"role":"system","content":%s},{"role":"user","content":%s}],'
+    b'"temperature":0.2,"max_tokens":4000}'
+)
+
+# 请求超时：推理模型非流式返回通常需要数十秒，总时长留足余量，连接阶段快速失败
+_API_TIMEOUT = aiohttp.ClientTimeout(total=180, connect=5)
+# 错误响应最多读取的字节数，网关返回的大HTML错误页无需整体缓存
+_ERROR_BODY_LIMIT = 4096
+
+# 会话信息提取用的预编译正则
+_RE_ELAPSED = re.compile(r'已经过去了(\d+)分钟')
+_RE_CALLS = re.compile(r'已被调用\s*(\d+)\s*次')
+_RE_CURTIME = re.compile(r'当前时间是([^\n,，]+)')
+
+# 思考过程起止标记，合并为单个正则一次扫描定位（同一位置时靠前的标记优先）
+_THINKING_RE = re.compile('|'.join(map(re.escape, [
+    "思考过程", "分析过程", "reasoning", "思考", "分析逻辑",
+    "判断理由", "决策理由", "分析思路"
+])))
+_THINKING_END_RE = re.compile('|'.join(map(re.escape, ["\n\n### ", "\n## ", "```", "---"])))
+# 完整分析结果必须包含的字段
+_REQUIRED_ANALYSIS_FIELDS = frozenset(("market_overview", "recommendations"))
+# 未能完整解析时保留的原始回复上限（字符），避免异常大回复拖垮下游日志
+_RAW_RESPONSE_LIMIT = 4096
+# 持仓方向标签，按 position_amt > 0 索引
+_DIRECTION = ("🔴 空头", "🟢 多头")
+# 文本回复中识别交易建议行的关键词（不区分大小写，按子串匹配）
+_SUGGESTION_KEYWORDS_RE = re.compile("buy|sell|long|short|建议|推荐", re.IGNORECASE)
+# 不触发执行的观望类操作
+_HOLD_WAIT = frozenset(("hold", "wait"))
+# 无明确标记时，回退段落需包含的关键词
+_FALLBACK_KEYWORDS_RE = re.compile("分析|判断|建议|因为|由于")
+
+# 增强版系统提示词（固定内容，模块加载时构建一次）
+_ENHANCED_SYSTEM_PROMPT = """🤖 你是一个自主交易AI，负责基于数据给出可直接执行的交易指令。
 
 ⏱️ 执行节奏：系统每15分钟进行一次分析与执行，因此你的入场、止盈、止损应考虑15分钟节奏与该窗口的波动特征，避免过密触发。
 
@@ -280,29 +171,12 @@ class EnhancedDeepSeekClient:
         "可能影响价格的因素"
     ]
 }"""
+_ENHANCED_SYSTEM_PROMPT_HASH = hashlib.blake2b(_ENHANCED_SYSTEM_PROMPT.encode('utf-8'), digest_size=8).hexdigest()
+# 本进程是否已在历史记录中写入过完整系统提示词
+_system_prompt_logged = False
 
-    def _build_comprehensive_analysis_prompt(
-        self,
-        futures_data: Dict[str, Any],
-        user_prompt: str,
-        symbols: List[str],
-        focus_timeframes: List[str]
-    ) -> str:
-        """构建全面分析提示"""
-
-        # 格式化市场数据摘要
-        market_summary = self._format_market_data_summary(futures_data, symbols)
-
-        # 格式化多时间周期数据
-        timeframe_analysis = self._format_timeframe_data(futures_data, symbols, focus_timeframes)
-
-        # 格式化期货特有数据
-        futures_specific = self._format_futures_specific_data(futures_data, symbols)
-
-        # 格式化当前持仓信息
-        position_status = self._format_position_status(futures_data)
-
-        prompt = f"""
+# 全面分析提示模板，固定部分只解析一次，每次调用仅填充动态段落
+_ANALYSIS_PROMPT_TEMPLATE = """
 请基于以下全面的期货市场数据进行深度分析:
 
 === 🏦 当前账户和持仓状态 ===
@@ -321,14 +195,14 @@ class EnhancedDeepSeekClient:
 {user_prompt}
 
 === 🎯 交易执行要求 ===
-1. 重点管理币种: {', '.join(symbols)}
-2. 核心分析时间周期: {', '.join(focus_timeframes)}
+1. 重点管理币种: {symbols_joined}
+2. 核心分析时间周期: {timeframes_joined}
 3. 进行多时间周期共振分析
 4. 评估期货特有风险 (资金费率、持仓量变化)
 5. 基于现有持仓状态做出交易决策
 
 === ⏰ 当前时间 ===
-{datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
+{current_time}
 
 🤖 你的交易决策将立即执行，请特别关注:
 - 🏦 当前持仓状态和可用资金
@@ -353,39 +227,336 @@ class EnhancedDeepSeekClient:
   * 若信心度（confidence）< 60，请优先选择 hold，避免过度交易和手续费滚动损耗
   * 只有信心度 ≥ 60 的建议会被执行，低于 60 的建议将被忽略
 """
-        return prompt
 
-    def _extract_thinking_process(self, response: Dict[str, Any]) -> str:
-        """从AI响应中提取思考过程"""
+_TF_UNIT_RANK = {"m": 0, "h": 1, "d": 2, "w": 3, "M": 4}
+# 市场概览中展示的1h指标
+_OVERVIEW_FIELDS = ("rsi", "sma_20", "macd")
+
+
+def _coerce_floats(d: Dict[str, Any], keys) -> Dict[str, float]:
+    """一次性将指定字段转换为float（缺失或为空时取0.0）"""
+    vals = {}
+    for k in keys:
+        v = d.get(k)
+        vals[k] = float(v) if v else 0.0
+    return vals
+
+
+# 指标分档阈值表：(上侧档位, 下侧档位)，上侧按阈值降序、下侧按阈值升序排列
+_RSI_BUCKETS = (((80, "严重超买"), (70, "超买")), ((20, "严重超卖"), (30, "超卖")))
+_BB_WIDTH_BUCKETS = (((5, "扩张"),), ((2, "收窄"),))
+_VOLUME_RATIO_BUCKETS = (((2, "明显放量"), (1.5, "放量")), ((0.5, "明显缩量"), (0.7, "缩量")))
+
+
+def _bucket_label(value: float, upper, lower, default: str = "正常") -> str:
+    """按阈值表给指标打标签：先匹配大于上侧阈值的档位，再匹配小于下侧阈值的档位"""
+    for threshold, label in upper:
+        if value > threshold:
+            return label
+    for threshold, label in lower:
+        if value < threshold:
+            return label
+    return default
+
+
+# ```json 代码块：取到下一个 ``` 为止，无结束标记时取到末尾
+_JSON_FENCE_RE = re.compile(r'```json(.*?)(?:```|\Z)', re.S)
+
+
+def _extract_json_block(content: str) -> Optional[str]:
+    """从模型回复中取出JSON文本：优先 ```json 代码块，其次整段以 { 开头的内容"""
+    m = _JSON_FENCE_RE.search(content)
+    if m:
+        return m.group(1).strip()
+    stripped = content.strip()
+    if stripped.startswith('{'):
+        return stripped
+    return None
+
+
+# 账户字段别名：(规范字段名, Binance原始字段名)
+_ACCOUNT_ALIASES = (
+    ('total_wallet_balance', 'totalWalletBalance'),
+    ('total_unrealized_pnl', 'totalUnrealizedProfit'),
+    ('total_margin_balance', 'totalMarginBalance'),
+    ('available_balance', 'availableBalance'),
+)
+_MISSING = object()
+
+
+def _normalize_account(account_info: Dict[str, Any]) -> Dict[str, float]:
+    """按别名表取出账户字段并转换为float：优先规范字段名，缺失时回退到原始字段名"""
+    account = {}
+    for key, alias in _ACCOUNT_ALIASES:
+        value = account_info.get(key, _MISSING)
+        if value is _MISSING:
+            value = account_info.get(alias, 0)
+        account[key] = float(value)
+    return account
+
+
+def _timeframe_sort_key(tf: str):
+    """时间周期按粒度升序排序（分钟→小时→日线→周线→月线，且数值从小到大）"""
+    try:
+        num = int(tf[:-1])
+        unit = tf[-1]
+    except Exception:
+        # 无法解析时放在最后
+        return (99, 9999)
+
+    return (_TF_UNIT_RANK.get(unit, 98), num)
+
+
+class EnhancedDeepSeekClient:
+    """增强版DeepSeek API客户端"""
+
+    def __init__(self, api_key: str, base_url: str = "https://api.deepseek.com"):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.session = None
+        self.logger = logging.getLogger(__name__)
+        self.enhanced_history_logger = EnhancedHistoryLogger()
+
+    async def __aenter__(self):
+        """异步上下文管理器入口"""
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器出口"""
+        await self.aclose()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """按需创建长连接会话，客户端整个生命周期内复用，避免每次分析重复TCP/TLS握手"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=_API_TIMEOUT,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+        return self.session
+
+    async def aclose(self):
+        """关闭会话（仅在程序退出时调用）"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def analyze_comprehensive_market_data(
+        self,
+        futures_data: Dict[str, Any],
+        user_prompt: str,
+        symbols: List[str] = ["BTC", "ETH", "SOL"],
+        focus_timeframes: List[str] = ["1m", "15m", "1h", "1d", "1M"]
+    ) -> Dict[str, Any]:
+        """
+        分析全面的期货市场数据
+
+        Args:
+            futures_data: 期货市场数据
+            user_prompt: 用户策略提示
+            symbols: 要分析的币种
+            focus_timeframes: 重点分析的时间周期
+
+        Returns:
+            详细的分析结果
+        """
+        # 历史记录以任务形式调度，与API请求重叠执行，返回前统一等待
+        log_tasks = []
+        start_time = time.time()
         try:
-            content = self._get_response_content(response)
+            # 本次分析统一使用的当前时间，避免各处重复读取时钟和格式化
+            now = datetime.now()
+            now_iso = now.isoformat()
 
-            # 查找思考过程部分
-            thinking_markers = [
-                "思考过程", "分析过程", "reasoning", "思考", "分析逻辑",
-                "判断理由", "决策理由", "分析思路"
-            ]
+            system_prompt = self._build_enhanced_system_prompt()
+            logged_system_prompt = self._system_prompt_for_log()
+            # 各格式化函数共用的 币种 -> 数据 映射，只查找一次
+            symbol_views = self._symbol_views(futures_data, symbols)
+            # 数据类型（期货/现货）对同一份数据不变，只检测一次
+            data_type = self._detect_data_type(futures_data)
+            analysis_prompt = self._build_comprehensive_analysis_prompt(
+                futures_data, user_prompt, symbols, focus_timeframes, symbol_views, now, data_type
+            )
 
-            for marker in thinking_markers:
-                if marker in content:
-                    # 找到标记后的内容
-                    start_idx = content.find(marker)
-                    thinking_section = content[start_idx:]
+            # 记录AI完整输入数据到 history/input.txt
+            log_tasks.append(asyncio.create_task(self.enhanced_history_logger.log_ai_input(
+                system_prompt=logged_system_prompt,
+                user_prompt=analysis_prompt,
+                analysis_context={
+                    "prompt_type": "comprehensive_futures_analysis",
+                    "symbols": symbols,
+                    "focus_timeframes": focus_timeframes,
+                    "analysis_type": "futures_comprehensive",
+                    "user_strategy": user_prompt,
+                    "timestamp": now_iso
+                }
+            )))
+
+            # 记录模型输入到原有文件（保持兼容性）
+            log_tasks.append(asyncio.create_task(self.enhanced_history_logger.log_model_input(
+                prompt_type="comprehensive_futures_analysis",
+                user_prompt=user_prompt,
+                system_prompt=logged_system_prompt,
+                market_data=futures_data,
+                symbols=symbols,
+                additional_context={
+                    "focus_timeframes": focus_timeframes,
+                    "analysis_type": "futures_comprehensive"
+                }
+            )))
+
+            response = await self._call_api(system_prompt, analysis_prompt)
+            result = self._parse_enhanced_analysis_response(response)
+
+            processing_time = time.time() - start_time
+
+            # 提取AI思考过程并记录到 think.txt（优先使用 reasoning_content 字段）
+            raw_content = self._get_response_content(response)
+            reasoning_content = result.get('reasoning_content') or self._extract_reasoning_content_from_response(raw_content)
+            thinking_process = reasoning_content or self._extract_thinking_process(raw_content)
+            if not thinking_process:
+                thinking_process = self._build_fallback_thinking(raw_content, result)
+            cleaned_thinking = self._clean_reasoning_text(thinking_process)
+
+            # 从user_prompt中提取session信息
+            session_info = self._extract_session_info(user_prompt, now_iso)
+
+            # 生成市场摘要
+            market_summary = self._generate_market_summary(futures_data, symbol_views, now)
+
+            # 提取最终决策
+            final_decision = self._extract_final_decision(result)
+
+            log_tasks.append(asyncio.create_task(self.enhanced_history_logger.log_ai_thinking(
+                session_info=session_info,
+                market_summary=market_summary,
+                reasoning_process=cleaned_thinking,
+                final_decision=final_decision
+            )))
 
-                    # 截取到下一个主要段落或结束
-                    end_markers = ["\n\n### ", "\n## ", "```", "---"]
-                    for end_marker in end_markers:
-                        if end_marker in thinking_section[50:]:  # 跳过前50个字符
-                            thinking_section = thinking_section[:thinking_section.find(end_marker, 50)]
-                            break
+            # 记录AI完整输出数据到 history/output.txt
+            log_tasks.append(asyncio.create_task(self.enhanced_history_logger.log_ai_output(
+                raw_response=response,
+                parsed_result=result,
+                processing_time=processing_time,
+                error_info=result.get('error') if 'error' in result else None
+            )))
 
-                    return thinking_section[:2000]  # 限制长度
+            # 记录模型输出到原有文件（保持兼容性）
+            log_tasks.append(asyncio.create_task(self.enhanced_history_logger.log_model_output(
+                output_type="comprehensive_futures_analysis_result",
+                model_response=result,
+                processing_time=processing_time,
+                symbols=symbols
+            )))
+
+            # 日志异常不影响分析结果
+            await asyncio.gather(*log_tasks, return_exceptions=True)
+            return result
+
+        except Exception as e:
+            self.logger.error(f"分析全面市场数据时出错: {e}")
+
+            error_result = {"error": str(e), "recommendations": []}
+
+            # 先等待已调度的输入记录完成，保证写入顺序
+            if log_tasks:
+                await asyncio.gather(*log_tasks, return_exceptions=True)
+
+            # 记录错误输出到 history/output.txt
+            await self.enhanced_history_logger.log_ai_output(
+                raw_response={"error": str(e)},
+                parsed_result=error_result,
+                processing_time=time.time() - start_time,
+                error_info=str(e)
+            )
+
+            # 记录错误到原有文件（保持兼容性）
+            await self.enhanced_history_logger.log_error(
+                error_type="deepseek_analysis_error",
+                error_message=str(e),
+                context={
+                    "symbols": symbols,
+                    "user_prompt": user_prompt,
+                    "focus_timeframes": focus_timeframes
+                }
+            )
+
+            return error_result
+
+    def _system_prompt_for_log(self) -> str:
+        """历史记录用的系统提示词：每个进程首次写完整内容，之后只写指纹"""
+        global _system_prompt_logged
+        if not _system_prompt_logged:
+            _system_prompt_logged = True
+            return f"[指纹 {_ENHANCED_SYSTEM_PROMPT_HASH}]\n{_ENHANCED_SYSTEM_PROMPT}"
+        return f"[系统提示词未变更，指纹 {_ENHANCED_SYSTEM_PROMPT_HASH}，完整内容见本进程首次记录]"
+
+    def _build_enhanced_system_prompt(self) -> str:
+        """构建增强版系统提示（内容固定，直接返回模块常量）"""
+        return _ENHANCED_SYSTEM_PROMPT
+
+    def _build_comprehensive_analysis_prompt(
+        self,
+        futures_data: Dict[str, Any],
+        user_prompt: str,
+        symbols: List[str],
+        focus_timeframes: List[str],
+        symbol_views: Dict[str, Dict[str, Any]],
+        now: Optional[datetime] = None,
+        data_type: Optional[str] = None
+    ) -> str:
+        """构建全面分析提示"""
+
+        # 格式化市场数据摘要
+        market_summary = self._format_market_data_summary(futures_data, symbol_views, data_type)
+
+        # 格式化多时间周期数据
+        timeframe_analysis = self._format_timeframe_data(symbol_views, focus_timeframes)
+
+        # 格式化期货特有数据
+        futures_specific = self._format_futures_specific_data(symbol_views)
+
+        # 格式化当前持仓信息
+        position_status = self._format_position_status(futures_data)
+
+        return _ANALYSIS_PROMPT_TEMPLATE.format_map({
+            "position_status": position_status,
+            "market_summary": market_summary,
+            "timeframe_analysis": timeframe_analysis,
+            "futures_specific": futures_specific,
+            "user_prompt": user_prompt,
+            "symbols_joined": ', '.join(symbols),
+            "timeframes_joined": ', '.join(focus_timeframes),
+            "current_time": (now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        })
+
+    def _extract_thinking_process(self, content: str) -> str:
+        """从AI响应内容中提取思考过程"""
+        try:
+
+            # 查找思考过程部分（取最早出现的标记）
+            start_match = _THINKING_RE.search(content)
+            if start_match:
+                # 找到标记后的内容
+                thinking_section = content[start_match.start():]
+
+                # 截取到下一个主要段落或结束（跳过前50个字符）
+                end_match = _THINKING_END_RE.search(thinking_section, 50)
+                if end_match:
+                    thinking_section = thinking_section[:end_match.start()]
+
+                return thinking_section[:2000]  # 限制长度
 
             # 如果没有找到明确的思考过程标记，尝试提取最后一段
             if content:
                 paragraphs = content.split('\n\n')
                 for paragraph in reversed(paragraphs):
-                    if len(paragraph) > 100 and any(word in paragraph for word in ["分析", "判断", "建议", "因为", "由于"]):
+                    if len(paragraph) > 100 and _FALLBACK_KEYWORDS_RE.search(paragraph):
                         return paragraph[:1000]
 
             return ""
@@ -407,19 +578,12 @@ class EnhancedDeepSeekClient:
             pass
         return ''
 
-    def _extract_reasoning_content_from_response(self, response: Any) -> Optional[str]:
-        """从模型响应的 JSON 中提取 reasoning_content 字段"""
+    def _extract_reasoning_content_from_response(self, content: str) -> Optional[str]:
+        """从模型响应内容的 JSON 中提取 reasoning_content 字段"""
         try:
-            content = self._get_response_content(response)
             if not content:
                 return None
-            json_str = None
-            if '```json' in content:
-                start = content.find('```json') + 7
-                end = content.find('```', start)
-                json_str = content[start:end].strip() if end > start else content[start:].strip()
-            elif content.strip().startswith('{'):
-                json_str = content.strip()
+            json_str = _extract_json_block(content)
             if not json_str:
                 return None
             data = json.loads(json_str)
@@ -514,37 +678,52 @@ class EnhancedDeepSeekClient:
         except Exception:
             return text[:max_len]
 
-    def _extract_session_info(self, user_prompt: str) -> Dict[str, Any]:
-        """从用户提示中提取会话信息"""
+    def _extract_session_info(self, user_prompt: str, default_iso: Optional[str] = None) -> Dict[str, Any]:
+        """从用户提示中提取会话信息（default_iso 为提示中没有当前时间时的默认值）"""
+        default_iso = default_iso or datetime.now().isoformat()
         try:
             session_info = {
                 "elapsed_minutes": 0,
                 "call_count": 0,
-                "current_time": datetime.now().isoformat()
+                "current_time": default_iso
             }
 
             # 提取已过去的分钟数
-            import re
-            minutes_match = re.search(r'已经过去了(\d+)分钟', user_prompt)
+            minutes_match = _RE_ELAPSED.search(user_prompt)
             if minutes_match:
                 session_info["elapsed_minutes"] = int(minutes_match.group(1))
 
             # 提取调用次数
-            count_match = re.search(r'已被调用\s*(\d+)\s*次', user_prompt)
+            count_match = _RE_CALLS.search(user_prompt)
             if count_match:
                 session_info["call_count"] = int(count_match.group(1))
 
             # 提取当前时间
-            time_match = re.search(r'当前时间是([^\n,，]+)', user_prompt)
+            time_match = _RE_CURTIME.search(user_prompt)
             if time_match:
                 session_info["current_time"] = time_match.group(1).strip()
 
             return session_info
         except Exception as e:
             self.logger.warning(f"提取会话信息失败: {e}")
-            return {"elapsed_minutes": 0, "call_count": 0, "current_time": datetime.now().isoformat()}
+            return {"elapsed_minutes": 0, "call_count": 0, "current_time": default_iso}
+
+    def _symbol_views(self, futures_data: Dict[str, Any], symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """按symbols顺序返回 币种 -> 币种数据（仅包含存在数据的币种）"""
+        symbols_data = futures_data.get('symbols', {})
+        views = {}
+        for symbol in symbols:
+            symbol_data = symbols_data.get(f"{symbol}USDT")
+            if symbol_data is not None:
+                views[symbol] = symbol_data
+        return views
 
-    def _generate_market_summary(self, futures_data: Dict[str, Any], symbols: List[str]) -> str:
+    def _generate_market_summary(
+        self,
+        futures_data: Dict[str, Any],
+        symbol_views: Dict[str, Dict[str, Any]],
+        now: Optional[datetime] = None
+    ) -> str:
         """生成市场摘要"""
         try:
             summary_parts = []
@@ -557,17 +736,13 @@ class EnhancedDeepSeekClient:
                 summary_parts.append(f"账户余额: {balance:.2f} USDT, 未实现盈亏: {pnl:.2f} USDT")
 
             # 主要币种价格
-            symbols_data = futures_data.get('symbols', {})
             prices = []
-            for symbol in symbols:
-                symbol_key = f"{symbol}USDT"
-                if symbol_key in symbols_data:
-                    symbol_data = symbols_data[symbol_key]
-                    ticker = symbol_data.get('ticker', {})
-                    price = ticker.get('price', 0) or ticker.get('lastPrice', 0)
-                    change_pct = ticker.get('priceChangePercent', 0) or ticker.get('priceChange', 0)
-                    if price:
-                        prices.append(f"{symbol}: ${price:.2f} ({change_pct:+.2f}%)")
+            for symbol, symbol_data in symbol_views.items():
+                ticker = symbol_data.get('ticker', {})
+                price = ticker.get('price', 0) or ticker.get('lastPrice', 0)
+                change_pct = ticker.get('priceChangePercent', 0) or ticker.get('priceChange', 0)
+                if price:
+                    prices.append(f"{symbol}: ${price:.2f} ({change_pct:+.2f}%)")
 
             if prices:
                 summary_parts.append("主要币种: " + ", ".join(prices))
@@ -575,7 +750,7 @@ class EnhancedDeepSeekClient:
             return " | ".join(summary_parts)
         except Exception as e:
             self.logger.warning(f"生成市场摘要失败: {e}")
-            return f"市场数据于 {datetime.now().strftime('%H:%M:%S')} 获取"
+            return f"市场数据于 {(now or datetime.now()).strftime('%H:%M:%S')} 获取"
 
     def _extract_final_decision(self, result: Dict[str, Any]) -> str:
         """提取最终交易决策"""
@@ -583,22 +758,21 @@ class EnhancedDeepSeekClient:
             decisions = []
 
             # 提取交易建议
-            trading_decisions = result.get('trading_decisions', []) or result.get('recommendations', [])
-            if trading_decisions:
-                for decision in trading_decisions:
-                    symbol = decision.get('symbol', '')
-                    action = decision.get('action', '')
-                    confidence = decision.get('confidence', 0)
-                    leverage = decision.get('leverage', 1)
-                    should_execute = decision.get('should_execute', False)
-
-                    # 如果没有明确的should_execute字段，根据action和confidence判断
-                    if not should_execute:
-                        if action.lower() not in ['hold', 'wait'] and confidence >= 60:
-                            should_execute = True
-
-                    status = "✅执行" if should_execute else "⚠️观察"
-                    decisions.append(f"{symbol} {action.upper()} {leverage}x (信心度{confidence}%) {status}")
+            trading_decisions = result.get('trading_decisions') or result.get('recommendations') or ()
+            for decision in trading_decisions:
+                symbol = decision.get('symbol', '')
+                action = decision.get('action', '')
+                confidence = decision.get('confidence', 0)
+                leverage = decision.get('leverage', 1)
+                should_execute = decision.get('should_execute', False)
+
+                # 如果没有明确的should_execute字段，根据action和confidence判断
+                if not should_execute:
+                    if action.lower() not in _HOLD_WAIT and confidence >= 60:
+                        should_execute = True
+
+                status = "✅执行" if should_execute else "⚠️观察"
+                decisions.append(f"{symbol} {action.upper()} {leverage}x (信心度{confidence}%) {status}")
 
             # 提取市场概览
             market_overview = result.get('market_overview', {})
@@ -616,12 +790,17 @@ class EnhancedDeepSeekClient:
             self.logger.warning(f"提取最终决策失败: {e}")
             return "分析完成，请查看详细结果"
 
-    def _format_market_data_summary(self, futures_data: Dict[str, Any], symbols: List[str]) -> str:
+    def _format_market_data_summary(
+        self,
+        futures_data: Dict[str, Any],
+        symbol_views: Dict[str, Dict[str, Any]],
+        data_type: Optional[str] = None
+    ) -> str:
         """格式化市场数据摘要"""
         summary_parts = []
 
-        # 检测数据类型（期货或现货）
-        data_type = self._detect_data_type(futures_data)
+        # 检测数据类型（期货或现货），调用方已检测时直接使用
+        data_type = data_type or self._detect_data_type(futures_data)
 
         # 账户信息
         account_info = futures_data.get('account_info', {})
@@ -641,32 +820,24 @@ class EnhancedDeepSeekClient:
                 summary_parts.append(f"- {pos['symbol']}: {pos['position_amount']:.4f}, 盈亏: {pos['unrealized_pnl']:.2f} USDT")
 
         # 各币种基础信息
-        symbols_data = futures_data.get('symbols', {})
-        for symbol in symbols:
-            symbol_key = f"{symbol}USDT"
-            if symbol_key in symbols_data:
-                symbol_data = symbols_data[symbol_key]
-
-                # 根据数据类型选择正确的数据源
-                price, change_pct, volume, high_24h, low_24h = self._extract_price_data(symbol_data, data_type)
+        for symbol, symbol_data in symbol_views.items():
+            # 根据数据类型选择正确的数据源
+            price, change_pct, volume, high_24h, low_24h = self._extract_price_data(symbol_data, data_type)
 
-                # 同时包含技术指标 (从timeframe_indicators中获取1h数据作为概览)
-                timeframe_indicators = symbol_data.get('timeframe_indicators', {})
-                indicators_1h = timeframe_indicators.get('1h', {})
-                rsi = indicators_1h.get('rsi', 0) or 0
-                sma_20 = indicators_1h.get('sma_20', 0) or 0
-                macd = indicators_1h.get('macd', 0) or 0
+            # 同时包含技术指标 (从timeframe_indicators中获取1h数据作为概览)
+            timeframe_indicators = symbol_data.get('timeframe_indicators', {})
+            overview = _coerce_floats(timeframe_indicators.get('1h', {}), _OVERVIEW_FIELDS)
 
-                summary_parts.append(f"""
+            summary_parts.append(f"""
 {symbol}USDT ({data_type}):
 - 当前价格: ${float(price):,.2f}
 - 24h涨跌: {float(change_pct):.2f}%
 - 24h最高: ${float(high_24h):,.2f}
 - 24h最低: ${float(low_24h):,.2f}
 - 24h成交量: {float(volume):,.0f}
-- RSI: {float(rsi):.1f}
-- SMA20: ${float(sma_20):,.2f}
-- MACD: {float(macd):.2f}
+- RSI: {overview['rsi']:.1f}
+- SMA20: ${overview['sma_20']:,.2f}
+- MACD: {overview['macd']:.2f}
 """)
 
         return '\n'.join(summary_parts)
@@ -683,6 +854,8 @@ class EnhancedDeepSeekClient:
         """
         # 检查数据类型标识符
         data_type = market_data.get('data_type', '')
+        if data_type == "futures" or data_type == "spot":
+            return data_type
         if data_type:
             if 'futures' in data_type:
                 return "futures"
@@ -761,39 +934,20 @@ class EnhancedDeepSeekClient:
 
     def _format_timeframe_data(
         self,
-        futures_data: Dict[str, Any],
-        symbols: List[str],
+        symbol_views: Dict[str, Dict[str, Any]],
         focus_timeframes: List[str]
     ) -> str:
         """格式化多时间周期数据"""
         timeframe_parts = []
 
-        symbols_data = futures_data.get('symbols', {})
-
-        for symbol in symbols:
-            symbol_key = f"{symbol}USDT"
-            if symbol_key not in symbols_data:
-                continue
+        # 时间周期排序与币种无关，只排一次
+        sorted_tfs = sorted(focus_timeframes, key=_timeframe_sort_key)
 
-            symbol_data = symbols_data[symbol_key]
+        for symbol, symbol_data in symbol_views.items():
             timeframe_indicators = symbol_data.get('timeframe_indicators', {})
 
             timeframe_parts.append(f"\n=== {symbol} 多时间周期分析 ===")
 
-            # 将时间周期按粒度升序排序（分钟→小时→日线→周线→月线，且数值从小到大）
-            def tf_key(tf: str):
-                try:
-                    num = int(tf[:-1])
-                    unit = tf[-1]
-                except Exception:
-                    # 无法解析时放在最后
-                    return (99, 9999)
-
-                unit_rank = {"m": 0, "h": 1, "d": 2, "w": 3, "M": 4}.get(unit, 98)
-                return (unit_rank, num)
-
-            sorted_tfs = sorted(focus_timeframes, key=tf_key)
-
             for timeframe in sorted_tfs:
                 if timeframe not in timeframe_indicators:
                     continue
@@ -842,7 +996,7 @@ class EnhancedDeepSeekClient:
                 # RSI 强度指标
                 rsi = indicators.get('rsi')
                 if rsi:
-                    rsi_status = "严重超买" if rsi > 80 else "超买" if rsi > 70 else "严重超卖" if rsi < 20 else "超卖" if rsi < 30 else "正常"
+                    rsi_status = _bucket_label(rsi, *_RSI_BUCKETS)
                     timeframe_parts.append(f"- RSI: {rsi:.1f} ({rsi_status})")
 
                 # MACD 系统
@@ -861,7 +1015,7 @@ class EnhancedDeepSeekClient:
                 bb_width = indicators.get('bb_width')
                 bb_position = indicators.get('bb_position')
                 if bb_upper and bb_lower:
-                    width_status = "收窄" if bb_width and bb_width < 2 else "扩张" if bb_width and bb_width > 5 else "正常"
+                    width_status = _bucket_label(bb_width, *_BB_WIDTH_BUCKETS) if bb_width else "正常"
                     position_desc = f"位于带内{bb_position:.0f}%位置" if bb_position else ""
                     timeframe_parts.append(f"- 布林带: 上轨${bb_upper:.2f}, 下轨${bb_lower:.2f} (带宽{width_status}, {position_desc})")
 
@@ -884,7 +1038,7 @@ class EnhancedDeepSeekClient:
                 volume_sma = indicators.get('volume_sma')
                 volume_ratio = indicators.get('volume_ratio')
                 if volume_ratio:
-                    vol_status = "明显放量" if volume_ratio > 2 else "放量" if volume_ratio > 1.5 else "明显缩量" if volume_ratio < 0.5 else "缩量" if volume_ratio < 0.7 else "正常"
+                    vol_status = _bucket_label(volume_ratio, *_VOLUME_RATIO_BUCKETS)
                     timeframe_parts.append(f"- 成交量: {vol_status} (比率: {volume_ratio:.2f}x)")
 
                 # 价格统计
@@ -911,18 +1065,11 @@ class EnhancedDeepSeekClient:
 
         return '\n'.join(timeframe_parts)
 
-    def _format_futures_specific_data(self, futures_data: Dict[str, Any], symbols: List[str]) -> str:
+    def _format_futures_specific_data(self, symbol_views: Dict[str, Dict[str, Any]]) -> str:
         """格式化期货特有数据"""
         futures_parts = []
 
-        symbols_data = futures_data.get('symbols', {})
-
-        for symbol in symbols:
-            symbol_key = f"{symbol}USDT"
-            if symbol_key not in symbols_data:
-                continue
-
-            symbol_data = symbols_data[symbol_key]
+        for symbol, symbol_data in symbol_views.items():
             funding_info = symbol_data.get('funding_info', {})
 
             futures_parts.append(f"\n=== {symbol} 期货数据 ===")
@@ -961,48 +1108,37 @@ class EnhancedDeepSeekClient:
 
     async def _call_api(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
         """调用DeepSeek API"""
-        if not self.session:
-            raise RuntimeError("Session not initialized. Use async context manager.")
-
-        payload = {
-            "model": "deepseek-reasoner",
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            "temperature": 0.2,  # 降低温度以获得更一致的分析
-            "max_tokens": 4000   # 增加token限制以支持更详细的分析
-        }
+        session = self._ensure_session()
 
-        async with self.session.post(
-            f"{self.base_url}/v1/chat/completions",
-            json=payload
-        ) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                error_text = await response.text()
-                raise Exception(f"API调用失败: {response.status} - {error_text}")
+        body = _PAYLOAD_TEMPLATE % (_json_dumps_bytes(system_prompt), _json_dumps_bytes(user_prompt))
+
+        try:
+            async with session.post(
+                f"{self.base_url}/v1/chat/completions",
+                data=body
+            ) as response:
+                if response.status == 200:
+                    # 直接解析原始字节，省去先解码为str的一次拷贝
+                    return _json_loads(await response.read())
+                else:
+                    error_chunk = await response.content.read(_ERROR_BODY_LIMIT)
+                    error_text = error_chunk.decode('utf-8', 'replace')
+                    raise Exception(f"API调用失败: {response.status} - {error_text}")
+        except asyncio.TimeoutError:
+            # 超时异常本身没有消息，转换为可读的错误，由调用方按普通失败处理
+            raise Exception(f"API调用超时（连接{_API_TIMEOUT.connect}秒/总计{_API_TIMEOUT.total}秒）")
 
     def _parse_enhanced_analysis_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
         """解析增强版API响应"""
+        content = ""
         try:
             content = response["choices"][0]["message"]["content"]
+            if not content:
+                self.logger.error("解析响应失败: API返回内容为空")
+                return {"error": "API返回内容为空", "recommendations": []}
 
-            # 尝试解析JSON响应
-            # 处理包含代码块标记的JSON
-            if '```json' in content:
-                # 提取JSON部分
-                start = content.find('```json') + 7
-                end = content.find('```', start)
-                if end > start:
-                    json_content = content[start:end].strip()
-                else:
-                    json_content = content[start:].strip()
-            elif content.strip().startswith('{'):
-                json_content = content.strip()
-            else:
-                json_content = None
+            # 尝试解析JSON响应（支持代码块标记包裹的JSON）
+            json_content = _extract_json_block(content)
 
             if json_content:
                 parsed_json = json.loads(json_content)
@@ -1020,7 +1156,7 @@ class EnhancedDeepSeekClient:
                         "market_overview": parsed_json.get("market_overview", {}),
                         "recommendations": parsed_json.get("recommendations", []),
                         "analysis_quality": "partial",
-                        "raw_response": content
+                        "raw_response": content[:_RAW_RESPONSE_LIMIT]
                     }
                     if "reasoning_content" in parsed_json:
                         base["reasoning_content"] = parsed_json.get("reasoning_content")
@@ -1033,14 +1169,13 @@ class EnhancedDeepSeekClient:
             self.logger.error(f"解析响应失败: {e}")
             return {
                 "error": f"解析响应失败: {e}",
-                "raw_response": response,
+                "raw_response": content[:_RAW_RESPONSE_LIMIT] if content else response,
                 "fallback_analysis": "AI分析因格式问题无法完整解析，请检查原始响应"
             }
 
     def _validate_analysis_structure(self, parsed_result: Dict[str, Any]) -> bool:
         """验证分析结果结构"""
-        required_fields = ["market_overview", "recommendations"]
-        return all(field in parsed_result for field in required_fields)
+        return _REQUIRED_ANALYSIS_FIELDS <= parsed_result.keys()
 
     def _extract_key_insights(self, content: str) -> Dict[str, Any]:
         """从文本中提取关键洞察"""
@@ -1050,12 +1185,12 @@ class EnhancedDeepSeekClient:
             "market_analysis": content[:1000],  # 前1000字符作为市场分析
             "recommendations": [],
             "analysis_quality": "text_extracted",
-            "raw_response": content
+            "raw_response": content[:_RAW_RESPONSE_LIMIT]
         }
 
         # 尝试提取交易建议
         for line in lines:
-            if any(keyword in line.lower() for keyword in ['buy', 'sell', 'long', 'short', '建议', '推荐']):
+            if _SUGGESTION_KEYWORDS_RE.search(line):
                 insights["recommendations"].append({
                     "extracted_suggestion": line.strip(),
                     "confidence": 50,  # 默认中等信心度
@@ -1070,66 +1205,72 @@ class EnhancedDeepSeekClient:
             account_info = futures_data.get('account_info', {})
             positions = futures_data.get('positions', [])
 
-            # 账户信息 - 兼容两种字段名格式
-            total_wallet_balance = account_info.get('total_wallet_balance', account_info.get('totalWalletBalance', 0))
-            total_unrealized_pnl = account_info.get('total_unrealized_pnl', account_info.get('totalUnrealizedProfit', 0))
-            total_margin_balance = account_info.get('total_margin_balance', account_info.get('totalMarginBalance', 0))
-            available_balance = account_info.get('available_balance', account_info.get('availableBalance', 0))
+            # 账户信息 - 兼容两种字段名格式，每个字段只查找、转换一次
+            account = _normalize_account(account_info)
+            available_balance = account['available_balance']
 
-            status_text = f"""
+            # 逐段收集后一次性拼接
+            parts = [f"""
 💼 账户资金状态:
-- 总钱包余额: {float(total_wallet_balance):.2f} USDT
-- 总保证金余额: {float(total_margin_balance):.2f} USDT
-- 可用余额: {float(available_balance):.2f} USDT
-- 未实现盈亏: {float(total_unrealized_pnl):+.2f} USDT
+- 总钱包余额: {account['total_wallet_balance']:.2f} USDT
+- 总保证金余额: {account['total_margin_balance']:.2f} USDT
+- 可用余额: {available_balance:.2f} USDT
+- 未实现盈亏: {account['total_unrealized_pnl']:+.2f} USDT
 
-📍 当前持仓状态:"""
+📍 当前持仓状态:"""]
+
+            # 一次遍历筛出非零持仓，并保留已转换的持仓数量
+            active_positions = []
+            for pos in positions:
+                position_amt = float(pos.get('position_amount', 0))
+                if position_amt != 0:
+                    active_positions.append((pos, position_amt))
 
-            if not positions or all(float(pos.get('position_amount', 0)) == 0 for pos in positions):
-                status_text += "\n- 🆕 当前无持仓，可以自由建立新仓位"
+            if not active_positions:
+                parts.append("\n- 🆕 当前无持仓，可以自由建立新仓位")
             else:
-                active_positions = [pos for pos in positions if float(pos.get('position_amount', 0)) != 0]
-                for pos in active_positions:
+                for pos, position_amt in active_positions:
                     symbol = pos.get('symbol', '')
-                    position_amt = float(pos.get('position_amount', 0))
                     entry_price = float(pos.get('entry_price', 0))
                     mark_price = float(pos.get('mark_price', 0))
                     unrealized_pnl = float(pos.get('unrealized_pnl', 0))
                     percentage = float(pos.get('percentage', 0))
+                    leverage = int(pos.get('leverage', 1))
 
-                    direction = "🟢 多头" if position_amt > 0 else "🔴 空头"
+                    direction = _DIRECTION[position_amt > 0]
+                    base_asset = symbol[:-4] if symbol.endswith('USDT') else symbol
                     position_value = abs(position_amt) * mark_price
 
-                    status_text += f"""
+                    parts.append(f"""
 - 【{symbol}】{direction} 持仓:
-  * 仓位数量: {abs(position_amt):.6f} {symbol.replace('USDT', '')}
+  * 仓位数量: {abs(position_amt):.6f} {base_asset}
   * 入场价格: {entry_price:.2f} USDT
   * 当前价格: {mark_price:.2f} USDT
-  * 杠杆: {int(pos.get('leverage', 1))}x
+  * 杠杆: {leverage}x
   * 仓位价值: {position_value:.2f} USDT
-  * 未实现盈亏: {unrealized_pnl:+.2f} USDT ({percentage:+.2f}%)"""
+  * 未实现盈亏: {unrealized_pnl:+.2f} USDT ({percentage:+.2f}%)""")
 
                     # 获取该币种的止盈止损订单信息
                     stop_loss_info, take_profit_info = self._get_stop_orders_info(symbol, futures_data)
                     if stop_loss_info or take_profit_info:
-                        status_text += f"""
-  * 风险管理:"""
+                        parts.append(f"""
+  * 风险管理:""")
                         if stop_loss_info:
-                            status_text += f"""
-    - 止损订单: {stop_loss_info['price']:.2f} USDT (订单ID: {stop_loss_info['orderId']})"""
+                            parts.append(f"""
+    - 止损订单: {stop_loss_info['price']:.2f} USDT (订单ID: {stop_loss_info['orderId']})""")
                         if take_profit_info:
-                            status_text += f"""
-    - 止盈订单: {take_profit_info['price']:.2f} USDT (订单ID: {take_profit_info['orderId']})"""
+                            parts.append(f"""
+    - 止盈订单: {take_profit_info['price']:.2f} USDT (订单ID: {take_profit_info['orderId']})""")
 
-            status_text += f"""
+            parts.append(f"""
 
 🎯 交易决策提醒:
 - 你需要考虑现有持仓，避免重复建仓
-- 可用余额 {float(available_balance):.2f} USDT 可用于新仓位
+- 可用余额 {available_balance:.2f} USDT 可用于新仓位
 - 如有持仓，考虑是否需要加仓、减仓或平仓
-- 整体风险敞口管理和资金利用效率"""
+- 整体风险敞口管理和资金利用效率""")
 
-            return status_text.strip()
+            return "".join(parts).strip()
 
         except Exception as e:
             return f"❌ 获取持仓信息失败: {str(e)}"
@@ -2,8 +2,96 @@
 简单的配置管理器
 """
 import os
+import copy
+import json
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+try:
+    # 优先使用 libyaml 的C实现，解析速度明显快于纯Python版本
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# 进程内配置缓存：{绝对路径: (mtime_ns, size, config)}
+_CONFIG_MEMO: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+# 配置加载失败时使用的默认配置（只读模板，使用时返回深拷贝）
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'apis': {
+        'binance': {
+            'api_key': '',
+            'api_secret': '',
+            'testnet': True
+        },
+        'deepseek': {
+            'api_key': '',
+            'base_url': 'https://api.deepseek.com'
+        }
+    },
+    'trading': {
+        'symbols': ['BTCUSDT', 'ETHUSDT', 'SOLUSDT']
+    }
+}
+
+
+def load_config_cached(config_path: str) -> Dict[str, Any]:
+    """加载YAML配置，并以JSON旁路缓存（config_path + '.cache.json'）加速后续启动
+
+    缓存中记录源文件的 st_mtime_ns 与大小，任一变化即重新解析YAML并刷新缓存。
+    返回值为JSON规范化后的配置（日期等值转为字符串），无论是否命中缓存类型都一致；
+    缓存写入失败（如目录只读）不影响配置加载。
+    同一进程内重复加载未变化的配置时复用内存中的结果，每次返回独立的深拷贝，调用方修改互不影响。
+    """
+    st = os.stat(config_path)
+    memo_key = os.path.abspath(config_path)
+    memo = _CONFIG_MEMO.get(memo_key)
+    if memo is not None and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+        return copy.deepcopy(memo[2])
+
+    cache_path = config_path + '.cache.json'
+
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('mtime_ns') == st.st_mtime_ns and cached.get('size') == st.st_size:
+            _CONFIG_MEMO[memo_key] = (st.st_mtime_ns, st.st_size, cached['config'])
+            return copy.deepcopy(cached['config'])
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    # 以二进制读取，由libyaml直接处理字节流，省去Python文本层解码
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    # 按JSON往返的结果返回，使首次解析与命中旁路缓存时的值类型一致（如日期均为字符串）；
+    # 含JSON无法表示的内容（如以日期为键）时保留YAML原始结果，且不写缓存
+    try:
+        payload = json.dumps({'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'config': config},
+                             ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        payload = None
+    else:
+        config = json.loads(payload)['config']
+
+    # 原子写入：先写临时文件再替换；配置含API密钥，权限与源文件保持一致
+    if payload is not None:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.chmod(tmp_path, st.st_mode & 0o777)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # 目录只读等情况下放弃缓存，配置照常返回
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    _CONFIG_MEMO[memo_key] = (st.st_mtime_ns, st.st_size, config)
+    return copy.deepcopy(config)
+
 
 class ConfigManager:
     """配置管理器"""
@@ -22,29 +110,13 @@ class ConfigManager:
         return self._config
 
     def _load_config(self):
-        """加载配置文件"""
+        """加载配置文件（复用进程内缓存，load_config_cached 已返回实例独立的副本）"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f)
+            self._config = load_config_cached(self.config_path)
         except Exception as e:
             print(f"加载配置文件失败: {e}")
             self._config = self._get_default_config()
 
     def _get_default_config(self) -> Dict[str, Any]:
         """获取默认配置"""
-        return {
-            'apis': {
-                'binance': {
-                    'api_key': '',
-                    'api_secret': '',
-                    'testnet': True
-                },
-                'deepseek': {
-                    'api_key': '',
-                    'base_url': 'https://api.deepseek.com'
-                }
-            },
-            'trading': {
-                'symbols': ['BTCUSDT', 'ETHUSDT', 'SOLUSDT']
-            }
-        }
\ No newline at end of file
+        return copy.deepcopy(_DEFAULT_CONFIG)
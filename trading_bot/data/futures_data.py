@@ -7,9 +7,9 @@ import sys
 import os
 import asyncio
 import logging
+import aiohttp
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-import pandas as pd
 import numpy as np
 
 # 添加python-binance路径
@@ -18,9 +18,33 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../python-binance-ma
 from binance import AsyncClient, Client
 from binance.exceptions import BinanceAPIException
 
+from trading_bot.utils.indicators import ewm_mean, ewm_last
+
+# REST请求超时：总时长30秒，建立连接阶段快速失败
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
+# 连接池上限；同时在途的请求数由同等容量的信号量限制，超出的请求在信号量上排队，
+# 不会在aiohttp内部等待连接池空位而消耗connect超时（币种数量增加时也不会批量超时）
+_CONNECTION_LIMIT = 32
+
+# K线数值字段（按Binance返回的顺序），其中时间与成交笔数为整数列
+_KLINE_COLUMNS = (
+    'open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time',
+    'quote_asset_volume', 'number_of_trades',
+    'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume'
+)
+_KLINE_INT_COLUMNS = frozenset(('open_time', 'close_time', 'number_of_trades'))
+
+# 趋势强度回归窗口，及中心化的横坐标与其平方和（常数，只需计算一次）
+_TREND_WINDOW = 20
+_TREND_X = np.arange(_TREND_WINDOW, dtype=np.float64) - (_TREND_WINDOW - 1) / 2
+_TREND_SXX = float(_TREND_X @ _TREND_X)
+
 
 class FuturesDataManager:
-    """U本位合约数据管理器"""
+    """U本位合约数据管理器
+
+    应作为长生命周期的异步上下文使用（进入一次、反复调用），以便复用同一个keep-alive连接池。
+    """
 
     def __init__(self, api_key: str = None, api_secret: str = None, testnet: bool = True):
         self.api_key = api_key
@@ -44,12 +68,24 @@ class FuturesDataManager:
             "1M": {"limit": 36, "description": "月线"}       # 新增：3年数据，全局视角
         }
 
+        # 技术指标缓存：{(symbol, timeframe): (K线签名, 指标字典)}，每个币种/周期只保留最新一份
+        self._indicator_cache: Dict[Tuple[str, str], Tuple[tuple, Dict[str, Any]]] = {}
+
+        # 在途REST请求上限，与连接池容量一致
+        self._request_slots = asyncio.Semaphore(_CONNECTION_LIMIT)
+
     async def __aenter__(self):
         """异步上下文管理器入口"""
         try:
             # 配置网络参数 - 增加超时时间
             requests_params = {
-                'timeout': 30  # 增加超时时间到30秒
+                'timeout': _REQUEST_TIMEOUT
+            }
+            # 客户端整个生命周期复用同一个keep-alive连接池，避免重复TCP/TLS握手
+            session_params = {
+                'connector': aiohttp.TCPConnector(
+                    limit=_CONNECTION_LIMIT, ttl_dns_cache=300, keepalive_timeout=75
+                )
             }
 
             if self.api_key and self.api_secret:
@@ -57,13 +93,15 @@ class FuturesDataManager:
                     api_key=self.api_key,
                     api_secret=self.api_secret,
                     testnet=self.testnet,
-                    requests_params=requests_params
+                    requests_params=requests_params,
+                    session_params=session_params
                 )
             else:
                 # 只读模式，不需要API密钥
                 self.client = await AsyncClient.create(
                     testnet=self.testnet,
-                    requests_params=requests_params
+                    requests_params=requests_params,
+                    session_params=session_params
                 )
 
             self.logger.info("Binance期货客户端初始化成功")
@@ -77,10 +115,15 @@ class FuturesDataManager:
         if self.client:
             await self.client.close_connection()
 
+    async def _request(self, method, **kwargs):
+        """在连接池容量内发起REST请求，超出容量的请求在此排队"""
+        async with self._request_slots:
+            return await method(**kwargs)
+
     async def get_futures_exchange_info(self) -> Dict[str, Any]:
         """获取期货交易所信息"""
         try:
-            info = await self.client.futures_exchange_info()
+            info = await self._request(self.client.futures_exchange_info)
             return info
         except BinanceAPIException as e:
             self.logger.error(f"获取期货交易所信息失败: {e}")
@@ -92,7 +135,7 @@ class FuturesDataManager:
             if not self.api_key or not self.api_secret:
                 return {"error": "需要API密钥获取账户信息"}
 
-            account = await self.client.futures_account()
+            account = await self._request(self.client.futures_account)
             return {
                 "total_wallet_balance": float(account.get("totalWalletBalance", 0)),
                 "total_unrealized_pnl": float(account.get("totalUnrealizedPnL", 0)),
@@ -112,13 +155,13 @@ class FuturesDataManager:
             if not self.api_key or not self.api_secret:
                 return []
 
-            positions = await self.client.futures_position_information()
+            positions = await self._request(self.client.futures_position_information)
             active_positions = []
 
             # 账户positions 用于校准杠杆字段（部分场景接口返回不一致）
             leverage_map = {}
             try:
-                account = await self.client.futures_account()
+                account = await self._request(self.client.futures_account)
                 acct_positions = account.get("positions", []) if isinstance(account, dict) else []
                 for ap in acct_positions:
                     sym = ap.get("symbol")
@@ -167,11 +210,11 @@ class FuturesDataManager:
                 return {}
 
             if symbol:
-                orders = await self.client.futures_get_open_orders(symbol=symbol)
+                orders = await self._request(self.client.futures_get_open_orders, symbol=symbol)
                 return {symbol: self._format_orders(orders)}
             else:
                 # 获取所有未完成订单
-                orders = await self.client.futures_get_open_orders()
+                orders = await self._request(self.client.futures_get_open_orders)
 
                 # 按币种分组
                 orders_by_symbol = {}
@@ -230,199 +273,228 @@ class FuturesDataManager:
         if timeframes is None:
             timeframes = ["15m", "1h", "4h", "1d", "1M"]
 
-        multi_klines = {}
-
-        for timeframe in timeframes:
-            if timeframe not in self.timeframes:
-                continue
-
-            try:
-                config = self.timeframes[timeframe]
-                klines = await self.client.futures_klines(
-                    symbol=symbol,
-                    interval=timeframe,
-                    limit=config["limit"]
-                )
+        # 各时间周期的请求互不依赖，并发获取
+        valid_timeframes = [tf for tf in timeframes if tf in self.timeframes]
+        results = await asyncio.gather(
+            *(self._get_timeframe_klines(symbol, tf) for tf in valid_timeframes)
+        )
+        multi_klines = dict(zip(valid_timeframes, results))
 
-                formatted_klines = []
-                for kline in klines:
-                    formatted_klines.append({
-                        'open_time': int(kline[0]),
-                        'open': float(kline[1]),
-                        'high': float(kline[2]),
-                        'low': float(kline[3]),
-                        'close': float(kline[4]),
-                        'volume': float(kline[5]),
-                        'close_time': int(kline[6]),
-                        'quote_asset_volume': float(kline[7]),
-                        'number_of_trades': int(kline[8]),
-                        'taker_buy_base_asset_volume': float(kline[9]),
-                        'taker_buy_quote_asset_volume': float(kline[10])
-                    })
+        return multi_klines
 
-                multi_klines[timeframe] = {
-                    'data': formatted_klines,
-                    'description': config['description'],
-                    'count': len(formatted_klines)
-                }
+    async def _get_timeframe_klines(self, symbol: str, timeframe: str) -> Dict[str, Any]:
+        """获取单个时间周期的K线数据（失败时返回包含error的字典）"""
+        try:
+            config = self.timeframes[timeframe]
+            klines = await self._request(
+                self.client.futures_klines,
+                symbol=symbol,
+                interval=timeframe,
+                limit=config["limit"]
+            )
+
+            # 一次性解析为按列存储的数组（每列一个连续的NumPy数组），不再逐行构建字典
+            width = len(_KLINE_COLUMNS)
+            table = np.array([kline[:width] for kline in klines], dtype=np.float64).reshape(-1, width)
+            table = np.ascontiguousarray(table.T)
+            columns = {
+                name: table[i].astype(np.int64) if name in _KLINE_INT_COLUMNS else table[i]
+                for i, name in enumerate(_KLINE_COLUMNS)
+            }
+            count = len(klines)
 
-                self.logger.info(f"获取到{symbol} {timeframe} {len(formatted_klines)}条K线数据")
+            self.logger.info(f"获取到{symbol} {timeframe} {count}条K线数据")
 
-            except BinanceAPIException as e:
-                self.logger.error(f"获取{symbol} {timeframe}K线数据失败: {e}")
-                multi_klines[timeframe] = {'error': str(e)}
+            return {
+                'columns': columns,
+                'description': config['description'],
+                'count': count
+            }
 
-        return multi_klines
+        except Exception as e:
+            self.logger.error(f"获取{symbol} {timeframe}K线数据失败: {e}")
+            return {'error': str(e)}
 
     async def calculate_advanced_indicators(
         self,
-        klines_data: List[Dict],
-        timeframe: str = "1h"
+        klines_columns: Dict[str, np.ndarray],
+        timeframe: str = "1h",
+        symbol: str = None
     ) -> Dict[str, Any]:
         """
         计算高级技术指标
 
         Args:
-            klines_data: K线数据
+            klines_columns: 按列存储的K线数据（字段名 -> NumPy数组）
             timeframe: 时间周期
+            symbol: 币种符号，提供时启用指标缓存（K线未变化则直接复用上次结果）
 
         Returns:
             高级技术指标字典
         """
-        if not klines_data or len(klines_data) < 50:
+        if not klines_columns or len(klines_columns['close']) < 50:
             return {}
 
-        try:
-            df = pd.DataFrame(klines_data)
-            df['timestamp'] = pd.to_datetime(df['open_time'], unit='ms')
+        close = klines_columns['close']
+        high = klines_columns['high']
+        low = klines_columns['low']
+        volume = klines_columns['volume']
+        n = len(close)
+
+        # 最后一根K线尚未收盘，其价格与成交量随时变化，需一并计入签名
+        if symbol is not None:
+            cache_key = (symbol, timeframe)
+            open_time = klines_columns['open_time']
+            signature = (
+                n, open_time[0], open_time[-1],
+                close[-1], high[-1], low[-1], volume[-1]
+            )
+            cached = self._indicator_cache.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                return dict(cached[1])
 
+        try:
             indicators = {}
 
             # 基础价格信息
-            current_price = df['close'].iloc[-1]
+            current_price = close[-1]
             indicators['current_price'] = current_price
-            indicators['price_change_24h'] = ((current_price - df['close'].iloc[-24]) / df['close'].iloc[-24] * 100) if len(df) >= 24 else 0
+            indicators['price_change_24h'] = ((current_price - close[-24]) / close[-24] * 100) if n >= 24 else 0
 
+            # 以下指标只输出最新值，均值类指标只取末尾窗口计算，不再生成整列序列
+            # K线数量不少于50根时窗口均已填满，结果不会出现NaN，只有除数可能为0的指标需单独判断
             # 移动平均线系统
-            df['sma_7'] = df['close'].rolling(window=7).mean()
-            df['sma_20'] = df['close'].rolling(window=20).mean()
-            df['sma_50'] = df['close'].rolling(window=50).mean()
-            df['sma_200'] = df['close'].rolling(window=200).mean() if len(df) >= 200 else None
-
-            df['ema_12'] = df['close'].ewm(span=12).mean()
-            df['ema_26'] = df['close'].ewm(span=26).mean()
-            df['ema_50'] = df['close'].ewm(span=50).mean()
-
-            # RSI
-            delta = df['close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            df['rsi'] = 100 - (100 / (1 + rs))
+            sma_7 = close[-7:].mean()
+            close_20 = close[-20:]
+            sma_20 = close_20.mean()
+            sma_50 = close[-50:].mean()
+            sma_200 = close[-200:].mean() if n >= 200 else None
+
+            # EMA12/26 需要整列用于计算MACD信号线，EMA50只需最新值
+            ema_12 = ewm_mean(close, 12)
+            ema_26 = ewm_mean(close, 26)
+            ema_50 = ewm_last(close, 50)
+
+            # RSI：涨幅取差值的正部，跌幅由 涨幅 - 差值 精确得到，无需再做一次条件筛选
+            delta = np.diff(close[-15:])
+            gain = np.maximum(delta, 0.0)
+            loss = gain - delta
+            avg_gain = gain.mean()
+            avg_loss = loss.mean()
+            if avg_loss > 0:
+                rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+            else:
+                rsi = 100.0 if avg_gain > 0 else None  # 窗口内价格持平时RSI无定义
 
             # MACD
-            df['macd'] = df['ema_12'] - df['ema_26']
-            df['macd_signal'] = df['macd'].ewm(span=9).mean()
-            df['macd_histogram'] = df['macd'] - df['macd_signal']
-
-            # 布林带
-            df['bb_middle'] = df['close'].rolling(window=20).mean()
-            bb_std = df['close'].rolling(window=20).std()
-            df['bb_upper'] = df['bb_middle'] + (bb_std * 2)
-            df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
-            df['bb_width'] = (df['bb_upper'] - df['bb_lower']) / df['bb_middle'] * 100
-
-            # 波动率计算
-            df['returns'] = df['close'].pct_change()
-            if timeframe == "1h" and len(df) >= 168:
-                volatility_7d = df['returns'].rolling(window=168).std() * np.sqrt(24) * 100  # 7天波动率
+            macd_series = ema_12 - ema_26
+            macd = macd_series[-1]
+            macd_signal = ewm_last(macd_series, 9)
+            macd_histogram = macd - macd_signal
+
+            # 布林带：中轨即SMA20，样本标准差复用同一窗口及其均值
+            bb_middle = sma_20
+            bb_dev = close_20 - sma_20
+            bb_std = np.sqrt(bb_dev @ bb_dev / (len(close_20) - 1))
+            bb_upper = bb_middle + (bb_std * 2)
+            bb_lower = bb_middle - (bb_std * 2)
+            bb_width = (bb_upper - bb_lower) / bb_middle * 100
+
+            # 波动率计算（需要窗口长度+1根K线才能得到完整的收益率窗口，否则为None）
+            if timeframe == "1h" and n > 168:
+                returns_7d = close[-168:] / close[-169:-1] - 1
+                volatility_7d = returns_7d.std(ddof=1) * np.sqrt(24) * 100  # 7天波动率
             else:
-                volatility_7d = pd.Series(dtype=float)
+                volatility_7d = None
 
-            if timeframe == "1h" and len(df) >= 720:
-                volatility_30d = df['returns'].rolling(window=720).std() * np.sqrt(24) * 100  # 30天波动率
+            if timeframe == "1h" and n > 720:
+                returns_30d = close[-720:] / close[-721:-1] - 1
+                volatility_30d = returns_30d.std(ddof=1) * np.sqrt(24) * 100  # 30天波动率
             else:
-                volatility_30d = pd.Series(dtype=float)
+                volatility_30d = None
 
-            # ATR (平均真实波幅)
-            df['tr1'] = df['high'] - df['low']
-            df['tr2'] = abs(df['high'] - df['close'].shift())
-            df['tr3'] = abs(df['low'] - df['close'].shift())
-            df['tr'] = df[['tr1', 'tr2', 'tr3']].max(axis=1)
-            df['atr'] = df['tr'].rolling(window=14).mean()
+            # ATR (平均真实波幅)：最近14根K线的真实波幅均值，在高低差数组上原地取最大值
+            prev_close = close[-15:-1]
+            tr = high[-14:] - low[-14:]
+            np.maximum(tr, np.abs(high[-14:] - prev_close), out=tr)
+            np.maximum(tr, np.abs(low[-14:] - prev_close), out=tr)
+            atr = tr.mean()
 
             # 成交量指标
-            df['volume_sma'] = df['volume'].rolling(window=20).mean()
-            volume_ratio = df['volume'].iloc[-1] / df['volume_sma'].iloc[-1] if not pd.isna(df['volume_sma'].iloc[-1]) else 1
-
-            # 获取最新值
-            latest = df.iloc[-1]
+            volume_sma = volume[-20:].mean()
+            volume_ratio = volume[-1] / volume_sma if volume_sma > 0 else 1
 
             indicators.update({
                 # 移动平均线
-                'sma_7': latest['sma_7'] if not pd.isna(latest['sma_7']) else None,
-                'sma_20': latest['sma_20'] if not pd.isna(latest['sma_20']) else None,
-                'sma_50': latest['sma_50'] if not pd.isna(latest['sma_50']) else None,
-                'sma_200': latest['sma_200'] if latest['sma_200'] is not None and not pd.isna(latest['sma_200']) else None,
-                'ema_12': latest['ema_12'] if not pd.isna(latest['ema_12']) else None,
-                'ema_26': latest['ema_26'] if not pd.isna(latest['ema_26']) else None,
-                'ema_50': latest['ema_50'] if not pd.isna(latest['ema_50']) else None,
+                'sma_7': sma_7,
+                'sma_20': sma_20,
+                'sma_50': sma_50,
+                'sma_200': sma_200,
+                'ema_12': ema_12[-1],
+                'ema_26': ema_26[-1],
+                'ema_50': ema_50,
 
                 # 趋势指标
-                'rsi': latest['rsi'] if not pd.isna(latest['rsi']) else None,
-                'macd': latest['macd'] if not pd.isna(latest['macd']) else None,
-                'macd_signal': latest['macd_signal'] if not pd.isna(latest['macd_signal']) else None,
-                'macd_histogram': latest['macd_histogram'] if not pd.isna(latest['macd_histogram']) else None,
+                'rsi': rsi,
+                'macd': macd,
+                'macd_signal': macd_signal,
+                'macd_histogram': macd_histogram,
 
                 # 布林带
-                'bb_upper': latest['bb_upper'] if not pd.isna(latest['bb_upper']) else None,
-                'bb_middle': latest['bb_middle'] if not pd.isna(latest['bb_middle']) else None,
-                'bb_lower': latest['bb_lower'] if not pd.isna(latest['bb_lower']) else None,
-                'bb_width': latest['bb_width'] if not pd.isna(latest['bb_width']) else None,
-                'bb_position': ((current_price - latest['bb_lower']) / (latest['bb_upper'] - latest['bb_lower']) * 100) if not pd.isna(latest['bb_upper']) and not pd.isna(latest['bb_lower']) else None,
+                'bb_upper': bb_upper,
+                'bb_middle': bb_middle,
+                'bb_lower': bb_lower,
+                'bb_width': bb_width,
+                'bb_position': ((current_price - bb_lower) / (bb_upper - bb_lower) * 100) if bb_upper > bb_lower else None,
 
                 # 波动率
-                'volatility_7d': volatility_7d.iloc[-1] if not volatility_7d.empty and not pd.isna(volatility_7d.iloc[-1]) else None,
-                'volatility_30d': volatility_30d.iloc[-1] if not volatility_30d.empty and not pd.isna(volatility_30d.iloc[-1]) else None,
-                'atr': latest['atr'] if not pd.isna(latest['atr']) else None,
-                'atr_percentage': (latest['atr'] / current_price * 100) if not pd.isna(latest['atr']) else None,
+                'volatility_7d': volatility_7d,
+                'volatility_30d': volatility_30d,
+                'atr': atr,
+                'atr_percentage': atr / current_price * 100,
 
                 # 成交量
-                'volume': latest['volume'],
-                'volume_sma': latest['volume_sma'] if not pd.isna(latest['volume_sma']) else None,
+                'volume': volume[-1],
+                'volume_sma': volume_sma,
                 'volume_ratio': volume_ratio,
 
                 # 价格统计
-                'high_24h': df['high'].tail(24).max() if len(df) >= 24 else df['high'].max(),
-                'low_24h': df['low'].tail(24).min() if len(df) >= 24 else df['low'].min(),
-                'high_7d': df['high'].tail(168).max() if len(df) >= 168 and timeframe == "1h" else None,
-                'low_7d': df['low'].tail(168).min() if len(df) >= 168 and timeframe == "1h" else None,
+                'high_24h': high[-24:].max() if n >= 24 else high.max(),
+                'low_24h': low[-24:].min() if n >= 24 else low.min(),
+                'high_7d': high[-168:].max() if n >= 168 and timeframe == "1h" else None,
+                'low_7d': low[-168:].min() if n >= 168 and timeframe == "1h" else None,
 
                 # 趋势强度
-                'trend_strength': self._calculate_trend_strength(df),
-                'momentum': ((current_price - df['close'].iloc[-10]) / df['close'].iloc[-10] * 100) if len(df) >= 10 else 0
+                'trend_strength': self._calculate_trend_strength(close),
+                'momentum': ((current_price - close[-10]) / close[-10] * 100) if n >= 10 else 0
             })
 
+            if symbol is not None:
+                self._indicator_cache[cache_key] = (signature, indicators)
+                return dict(indicators)
             return indicators
 
         except Exception as e:
             self.logger.error(f"计算高级技术指标失败: {e}")
             return {}
 
-    def _calculate_trend_strength(self, df: pd.DataFrame) -> Optional[float]:
+    def clear_indicator_cache(self):
+        """清空技术指标缓存"""
+        self._indicator_cache.clear()
+
+    def _calculate_trend_strength(self, close: np.ndarray) -> Optional[float]:
         """计算趋势强度"""
         try:
-            if len(df) < 20:
+            if len(close) < _TREND_WINDOW:
                 return None
 
-            # 使用线性回归计算趋势强度
-            y = df['close'].tail(20).values
-            x = np.arange(len(y))
-
-            # 计算线性回归的R²值
-            correlation_matrix = np.corrcoef(x, y)
-            correlation = correlation_matrix[0, 1]
-            r_squared = correlation ** 2
+            # 使用线性回归计算趋势强度：R² = Sxy² / (Sxx·Syy)，横坐标已预先中心化
+            dy = close[-_TREND_WINDOW:] - close[-_TREND_WINDOW:].mean()
+            syy = dy @ dy
+            if syy <= 0:
+                return 0.0  # 价格完全持平，没有趋势
+            sxy = _TREND_X @ dy
+            r_squared = sxy * sxy / (_TREND_SXX * syy)
 
             return float(r_squared * 100)  # 转换为百分比
         except Exception:
@@ -431,7 +503,7 @@ class FuturesDataManager:
     async def get_funding_rate_history(self, symbol: str, limit: int = 100) -> List[Dict[str, Any]]:
         """获取资金费率历史"""
         try:
-            funding_rates = await self.client.futures_funding_rate(symbol=symbol, limit=limit)
+            funding_rates = await self._request(self.client.futures_funding_rate, symbol=symbol, limit=limit)
 
             formatted_rates = []
             for rate in funding_rates:
@@ -443,23 +515,103 @@ class FuturesDataManager:
                 })
 
             return formatted_rates
-        except BinanceAPIException as e:
-            self.logger.error(f"获取资金费率历史失败: {e}")
+        except Exception as e:
+            self.logger.error(f"获取{symbol}资金费率历史失败: {e}")
             return []
 
     async def get_open_interest(self, symbol: str) -> Dict[str, Any]:
         """获取持仓量信息"""
         try:
-            oi = await self.client.futures_open_interest(symbol=symbol)
+            oi = await self._request(self.client.futures_open_interest, symbol=symbol)
             return {
                 'symbol': oi['symbol'],
                 'open_interest': float(oi['openInterest']),
                 'timestamp': int(oi['time'])
             }
-        except BinanceAPIException as e:
-            self.logger.error(f"获取持仓量失败: {e}")
+        except Exception as e:
+            self.logger.error(f"获取{symbol}持仓量失败: {e}")
+            return {}
+
+    async def _get_ticker_info(self, symbol: str) -> Dict[str, Any]:
+        """获取24小时统计（失败时返回空字典）"""
+        try:
+            ticker = await self._request(self.client.futures_ticker, symbol=symbol)
+            return {
+                'last_price': float(ticker['lastPrice']),
+                'price_change': float(ticker['priceChange']),
+                'price_change_percent': float(ticker['priceChangePercent']),
+                'high_price': float(ticker['highPrice']),
+                'low_price': float(ticker['lowPrice']),
+                'volume': float(ticker['volume']),
+                'quote_volume': float(ticker['quoteVolume']),
+                'open_price': float(ticker['openPrice']),
+                # 在期货API中，prevClosePrice字段可能不存在，使用安全访问
+                'prev_close_price': float(ticker.get('prevClosePrice', ticker.get('lastPrice'))),
+                'count': int(ticker['count'])
+            }
+        except Exception as e:
+            self.logger.error(f"获取{symbol}基础信息失败: {e}")
+            return {}
+
+    async def _get_market_depth(self, symbol: str) -> Dict[str, Any]:
+        """获取订单簿深度（失败时返回空字典）"""
+        try:
+            depth = await self._request(self.client.futures_order_book, symbol=symbol, limit=10)
+            return {
+                'bids': [[float(bid[0]), float(bid[1])] for bid in depth['bids']],
+                'asks': [[float(ask[0]), float(ask[1])] for ask in depth['asks']],
+                'last_update_id': depth['lastUpdateId']
+            }
+        except Exception as e:
+            self.logger.error(f"获取{symbol}订单簿失败: {e}")
             return {}
 
+    async def _get_symbol_futures_data(self, symbol: str, include_historical: bool) -> Dict[str, Any]:
+        """并发获取单个币种的行情、K线、资金费率、持仓量与订单簿"""
+        requests = [
+            self._get_ticker_info(symbol),
+            self.get_funding_rate_history(symbol, 10),
+            self.get_open_interest(symbol),
+            self._get_market_depth(symbol)
+        ]
+        if include_historical:
+            # 替换原来的 4h 为 1m，保留其它时间周期
+            requests.append(self.get_multi_timeframe_klines(
+                symbol, ["15m", "1h", "1m", "1d", "1M"]
+            ))
+
+        results = await asyncio.gather(*requests)
+        basic_info, funding_rates, open_interest, market_depth = results[:4]
+
+        symbol_data = {
+            'symbol': symbol,
+            'basic_info': basic_info,
+            'technical_indicators': {},
+            'funding_info': {
+                'recent_rates': funding_rates,
+                'current_rate': funding_rates[0] if funding_rates else None,
+                'open_interest': open_interest
+            },
+            'market_depth': market_depth
+        }
+
+        # 获取多时间周期数据
+        if include_historical:
+            multi_klines = results[4]
+            symbol_data['multi_timeframe_data'] = multi_klines
+
+            # 计算每个时间周期的技术指标
+            symbol_data['timeframe_indicators'] = {}
+            for timeframe, kline_info in multi_klines.items():
+                if kline_info.get('count'):
+                    indicators = await self.calculate_advanced_indicators(
+                        kline_info['columns'], timeframe, symbol
+                    )
+                    symbol_data['timeframe_indicators'][timeframe] = indicators
+
+        self.logger.info(f"获取到{symbol}的全面期货数据")
+        return symbol_data
+
     async def get_comprehensive_futures_data(
         self,
         symbols: List[str] = None,
@@ -479,85 +631,44 @@ class FuturesDataManager:
             symbols = self.target_symbols
 
         try:
+            timestamp = datetime.now().isoformat()
+
+            # 账户数据与各币种数据互不依赖，一次性并发请求；
+            # 单项失败（网络错误、超时等）只影响该项，不丢弃其它已获取的数据
+            account_info, positions, open_orders, *symbol_results = await asyncio.gather(
+                self.get_futures_account_info(),
+                self.get_futures_positions(),
+                self.get_open_orders(),  # 添加未完成订单信息
+                *(self._get_symbol_futures_data(symbol, include_historical) for symbol in symbols),
+                return_exceptions=True
+            )
+
+            if isinstance(account_info, Exception):
+                self.logger.error(f"获取期货账户信息失败: {account_info}")
+                account_info = {"error": str(account_info)}
+            if isinstance(positions, Exception):
+                self.logger.error(f"获取期货持仓失败: {positions}")
+                positions = []
+            if isinstance(open_orders, Exception):
+                self.logger.error(f"获取未完成订单失败: {open_orders}")
+                open_orders = {}
+
+            symbols_data = {}
+            for symbol, result in zip(symbols, symbol_results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"获取{symbol}期货数据失败: {result}")
+                    continue
+                symbols_data[symbol] = result
+
             market_data = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'data_type': 'futures_comprehensive',
-                'account_info': await self.get_futures_account_info(),
-                'positions': await self.get_futures_positions(),
-                'open_orders': await self.get_open_orders(),  # 添加未完成订单信息
-                'symbols': {}
+                'account_info': account_info,
+                'positions': positions,
+                'open_orders': open_orders,
+                'symbols': symbols_data
             }
 
-            for symbol in symbols:
-                symbol_data = {
-                    'symbol': symbol,
-                    'basic_info': {},
-                    'technical_indicators': {},
-                    'funding_info': {},
-                    'market_depth': {}
-                }
-
-                # 获取24小时统计
-                try:
-                    ticker = await self.client.futures_ticker(symbol=symbol)
-                    symbol_data['basic_info'] = {
-                        'last_price': float(ticker['lastPrice']),
-                        'price_change': float(ticker['priceChange']),
-                        'price_change_percent': float(ticker['priceChangePercent']),
-                        'high_price': float(ticker['highPrice']),
-                        'low_price': float(ticker['lowPrice']),
-                        'volume': float(ticker['volume']),
-                        'quote_volume': float(ticker['quoteVolume']),
-                        'open_price': float(ticker['openPrice']),
-                        # 在期货API中，prevClosePrice字段可能不存在，使用安全访问
-                        'prev_close_price': float(ticker.get('prevClosePrice', ticker.get('lastPrice'))),
-                        'count': int(ticker['count'])
-                    }
-                except Exception as e:
-                    self.logger.error(f"获取{symbol}基础信息失败: {e}")
-
-                # 获取多时间周期数据
-                if include_historical:
-                    # 替换原来的 4h 为 1m，保留其它时间周期
-                    multi_klines = await self.get_multi_timeframe_klines(
-                        symbol, ["15m", "1h", "1m", "1d", "1M"]
-                    )
-                    symbol_data['multi_timeframe_data'] = multi_klines
-
-                    # 计算每个时间周期的技术指标
-                    symbol_data['timeframe_indicators'] = {}
-                    for timeframe, kline_info in multi_klines.items():
-                        if 'data' in kline_info and kline_info['data']:
-                            indicators = await self.calculate_advanced_indicators(
-                                kline_info['data'], timeframe
-                            )
-                            symbol_data['timeframe_indicators'][timeframe] = indicators
-
-                # 获取资金费率
-                funding_rates = await self.get_funding_rate_history(symbol, 10)
-                symbol_data['funding_info'] = {
-                    'recent_rates': funding_rates,
-                    'current_rate': funding_rates[0] if funding_rates else None
-                }
-
-                # 获取持仓量
-                open_interest = await self.get_open_interest(symbol)
-                symbol_data['funding_info']['open_interest'] = open_interest
-
-                # 获取订单簿深度
-                try:
-                    depth = await self.client.futures_order_book(symbol=symbol, limit=10)
-                    symbol_data['market_depth'] = {
-                        'bids': [[float(bid[0]), float(bid[1])] for bid in depth['bids']],
-                        'asks': [[float(ask[0]), float(ask[1])] for ask in depth['asks']],
-                        'last_update_id': depth['lastUpdateId']
-                    }
-                except Exception as e:
-                    self.logger.error(f"获取{symbol}订单簿失败: {e}")
-
-                market_data['symbols'][symbol] = symbol_data
-                self.logger.info(f"获取到{symbol}的全面期货数据")
-
             return market_data
 
         except Exception as e:
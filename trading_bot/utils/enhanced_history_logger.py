@@ -6,10 +6,43 @@
 import os
 import json
 import asyncio
+import functools
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
 import logging
 
+# 可选：orjson 加速记录内容序列化，未安装时使用标准库json
+try:
+    import orjson
+    _ORJSON_LOG_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """无法直接编码的对象：NumPy数组/数值转为列表或Python数值，其余转为字符串"""
+    tolist = getattr(obj, 'tolist', None)
+    return tolist() if tolist is not None else str(obj)
+
+
+def _dumps_pretty(obj: Any) -> str:
+    """序列化为缩进2格的JSON文本（保留中文），orjson无法处理时回退到json"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_json_default, option=_ORJSON_LOG_OPTIONS).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+
+
+def _run_in_thread(func):
+    """将同步写文件方法包装为协程，在默认线程池中执行，多个记录可真正并发且不阻塞事件循环"""
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, self, *args, **kwargs))
+    return wrapper
+
 
 class EnhancedHistoryLogger:
     """增强版历史记录记录器"""
@@ -74,13 +107,14 @@ class EnhancedHistoryLogger:
                 f.write("说明: 此文件记录AI分析师的思考过程和判断依据\n")
                 f.write("=" * 50 + "\n\n")
 
-    async def log_model_input(self,
-                             prompt_type: str,
-                             user_prompt: str,
-                             system_prompt: str,
-                             market_data: Optional[Dict[str, Any]] = None,
-                             symbols: Optional[List[str]] = None,
-                             additional_context: Optional[Dict[str, Any]] = None):
+    @_run_in_thread
+    def log_model_input(self,
+                       prompt_type: str,
+                       user_prompt: str,
+                       system_prompt: str,
+                       market_data: Optional[Dict[str, Any]] = None,
+                       symbols: Optional[List[str]] = None,
+                       additional_context: Optional[Dict[str, Any]] = None):
         """
         记录模型输入到input-history.txt
 
@@ -116,7 +150,7 @@ class EnhancedHistoryLogger:
 
                 if additional_context:
                     f.write("额外上下文:\n")
-                    f.write(f"{json.dumps(additional_context, indent=2, ensure_ascii=False)}\n\n")
+                    f.write(f"{_dumps_pretty(additional_context)}\n\n")
 
                 f.write("=" * 60 + "\n\n")
 
@@ -125,10 +159,11 @@ class EnhancedHistoryLogger:
         except Exception as e:
             self.logger.error(f"记录模型输入失败: {e}")
 
-    async def log_ai_input(self,
-                          system_prompt: str,
-                          user_prompt: str,
-                          analysis_context: Optional[Dict[str, Any]] = None):
+    @_run_in_thread
+    def log_ai_input(self,
+                    system_prompt: str,
+                    user_prompt: str,
+                    analysis_context: Optional[Dict[str, Any]] = None):
         """
         记录最终发送给AI的完整输入数据到 history/input.txt
 
@@ -146,7 +181,7 @@ class EnhancedHistoryLogger:
 
                 if analysis_context:
                     f.write("分析上下文:\n")
-                    f.write(json.dumps(analysis_context, indent=2, ensure_ascii=False))
+                    f.write(_dumps_pretty(analysis_context))
                     f.write("\n\n")
 
                 f.write("系统提示词:\n")
@@ -166,11 +201,12 @@ class EnhancedHistoryLogger:
         except Exception as e:
             self.logger.error(f"记录AI输入数据失败: {e}")
 
-    async def log_ai_output(self,
-                           raw_response: Dict[str, Any],
-                           parsed_result: Optional[Dict[str, Any]] = None,
-                           processing_time: Optional[float] = None,
-                           error_info: Optional[str] = None):
+    @_run_in_thread
+    def log_ai_output(self,
+                     raw_response: Dict[str, Any],
+                     parsed_result: Optional[Dict[str, Any]] = None,
+                     processing_time: Optional[float] = None,
+                     error_info: Optional[str] = None):
         """
         记录AI模型的输出数据到 history/output.txt
 
@@ -196,13 +232,13 @@ class EnhancedHistoryLogger:
 
                 f.write("原始API响应:\n")
                 f.write("-" * 30 + "\n")
-                f.write(json.dumps(raw_response, indent=2, ensure_ascii=False))
+                f.write(_dumps_pretty(raw_response))
                 f.write("\n\n")
 
                 if parsed_result:
                     f.write("解析后结果:\n")
                     f.write("-" * 30 + "\n")
-                    f.write(json.dumps(parsed_result, indent=2, ensure_ascii=False))
+                    f.write(_dumps_pretty(parsed_result))
                     f.write("\n\n")
 
                 f.write("=" * 80 + "\n\n")
@@ -212,11 +248,12 @@ class EnhancedHistoryLogger:
         except Exception as e:
             self.logger.error(f"记录AI输出数据失败: {e}")
 
-    async def log_ai_thinking(self,
-                             session_info: Dict[str, Any],
-                             market_summary: str,
-                             reasoning_process: str,
-                             final_decision: str):
+    @_run_in_thread
+    def log_ai_thinking(self,
+                       session_info: Dict[str, Any],
+                       market_summary: str,
+                       reasoning_process: str,
+                       final_decision: str):
         """
         记录AI的思考过程到 history/think.txt
 
@@ -322,11 +359,12 @@ class EnhancedHistoryLogger:
             self.logger.error(f"生成市场数据摘要失败: {e}")
             return f"市场数据摘要生成失败: {e}"
 
-    async def log_model_output(self,
-                              output_type: str,
-                              model_response: Dict[str, Any],
-                              processing_time: Optional[float] = None,
-                              symbols: Optional[List[str]] = None):
+    @_run_in_thread
+    def log_model_output(self,
+                        output_type: str,
+                        model_response: Dict[str, Any],
+                        processing_time: Optional[float] = None,
+                        symbols: Optional[List[str]] = None):
         """
         记录模型输出到history.txt
 
@@ -350,7 +388,7 @@ class EnhancedHistoryLogger:
                 # 格式化模型响应
                 f.write("模型响应:\n")
                 if isinstance(model_response, dict):
-                    f.write(json.dumps(model_response, indent=2, ensure_ascii=False))
+                    f.write(_dumps_pretty(model_response))
                 else:
                     f.write(str(model_response))
                 f.write("\n\n")
@@ -389,7 +427,7 @@ class EnhancedHistoryLogger:
                 f.write("-" * 30 + "\n")
 
                 f.write("行为详情:\n")
-                f.write(json.dumps(action_details, indent=2, ensure_ascii=False))
+                f.write(_dumps_pretty(action_details))
                 f.write("\n\n")
 
                 if execution_result:
@@ -412,7 +450,7 @@ class EnhancedHistoryLogger:
                             f.write(f"❌ 交易失败 - 错误: {execution_result.get('error', 'N/A')}\n")
                         f.write("-" * 20 + "\n")
 
-                    f.write(json.dumps(execution_result, indent=2, ensure_ascii=False))
+                    f.write(_dumps_pretty(execution_result))
                     f.write("\n\n")
 
                 f.write("=" * 60 + "\n\n")
@@ -479,7 +517,7 @@ class EnhancedHistoryLogger:
                     f.write("\n")
 
                 f.write("完整分析结果:\n")
-                f.write(json.dumps(analysis_result, indent=2, ensure_ascii=False))
+                f.write(_dumps_pretty(analysis_result))
                 f.write("\n\n")
 
                 f.write("=" * 60 + "\n\n")
@@ -512,7 +550,7 @@ class EnhancedHistoryLogger:
 
                 if context:
                     f.write("错误上下文:\n")
-                    f.write(json.dumps(context, indent=2, ensure_ascii=False))
+                    f.write(_dumps_pretty(context))
                     f.write("\n\n")
 
                 f.write("=" * 60 + "\n\n")
@@ -631,7 +669,7 @@ class EnhancedHistoryLogger:
 
                 # 详细数据
                 f.write("完整确认数据:\n")
-                f.write(json.dumps(confirmation_result, indent=2, ensure_ascii=False))
+                f.write(_dumps_pretty(confirmation_result))
                 f.write("\n\n")
 
                 f.write("=" * 60 + "\n\n")
@@ -0,0 +1,143 @@
+"""
+滚动指标计算模块
+基于NumPy的向量化实现：滚动均值/标准差在滑动窗口视图上逐窗口计算（不做整列累加，避免大数相消的精度损失），
+指数加权均值按块递推，均可复用预分配的输出数组
+"""
+
+from typing import Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _prepare_out(x: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """校验或创建与输入等长的float64输出数组"""
+    if out is None:
+        return np.empty(len(x), dtype=np.float64)
+    if out.shape != (len(x),):
+        raise ValueError(f"输出数组长度应为{len(x)}，实际为{out.shape}")
+    return out
+
+
+def rolling_mean(x: np.ndarray, window: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    滚动均值（与 pandas rolling(window).mean() 一致，前 window-1 个位置为NaN）
+
+    Args:
+        x: 一维数值数组
+        window: 窗口大小
+        out: 可选的预分配输出数组，长度需与x相同
+
+    Returns:
+        滚动均值数组（即out）
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = _prepare_out(x, out)
+    n = len(x)
+    if window <= 0:
+        raise ValueError("window必须为正整数")
+
+    if n < window:
+        out[:] = np.nan
+        return out
+
+    out[:window - 1] = np.nan
+    np.mean(sliding_window_view(x, window), axis=1, out=out[window - 1:])
+    return out
+
+
+def rolling_std(x: np.ndarray, window: int, out: Optional[np.ndarray] = None, ddof: int = 1) -> np.ndarray:
+    """
+    滚动标准差（默认样本标准差，与 pandas rolling(window).std() 一致）
+
+    每个窗口独立按两遍法计算（先求窗口均值，再求离差平方和），结果不受窗口之外数值量级的影响。
+
+    Args:
+        x: 一维数值数组
+        window: 窗口大小
+        out: 可选的预分配输出数组，长度需与x相同
+        ddof: 自由度修正，默认1
+
+    Returns:
+        滚动标准差数组（即out）
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = _prepare_out(x, out)
+    n = len(x)
+    if window <= ddof:
+        raise ValueError("window必须大于ddof")
+
+    if n < window:
+        out[:] = np.nan
+        return out
+
+    out[:window - 1] = np.nan
+    np.std(sliding_window_view(x, window), axis=1, ddof=ddof, out=out[window - 1:])
+    return out
+
+
+def ewm_mean(x: np.ndarray, span: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    指数加权移动平均（与 pandas ewm(span=span).mean() 一致，adjust=True）
+
+    y[t] = Σ decay^(t-i)·x[i] / Σ decay^(t-i)，decay = 1 - 2/(span+1)。
+    分子的递推在块内借助 decay 的负幂次转为累加和，块长度保证幂次不溢出，块间传递递推状态。
+    输入不应包含NaN。
+
+    Args:
+        x: 一维数值数组
+        span: 跨度，需不小于1
+        out: 可选的预分配输出数组，长度需与x相同
+
+    Returns:
+        指数加权均值数组（即out）
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = _prepare_out(x, out)
+    n = len(x)
+    if span < 1:
+        raise ValueError("span必须不小于1")
+
+    alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
+    if n == 0:
+        return out
+    if decay == 0.0:
+        out[:] = x
+        return out
+
+    block = max(1, int(600.0 / -np.log(decay)))  # decay^-block 不超过 e^600
+    carry = 0.0  # 上一块末尾的分子
+    for start in range(0, n, block):
+        seg = x[start:start + block]
+        k = np.arange(len(seg), dtype=np.float64)
+        decay_k = decay ** k
+        numer = np.cumsum(seg / decay_k) * decay_k + carry * decay * decay_k
+        out[start:start + len(seg)] = numer
+        carry = numer[-1]
+
+    # 分母为等比数列之和：(1 - decay^(t+1)) / alpha
+    out /= (1.0 - decay ** np.arange(1, n + 1, dtype=np.float64)) / alpha
+    return out
+
+
+def ewm_last(x: np.ndarray, span: float) -> float:
+    """
+    指数加权移动平均的最新值（与 ewm_mean(x, span)[-1] 一致），只需一次加权求和而不计算整列
+
+    Args:
+        x: 一维数值数组
+        span: 跨度，需不小于1
+
+    Returns:
+        最新的指数加权均值（x为空时为NaN）
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if span < 1:
+        raise ValueError("span必须不小于1")
+    if len(x) == 0:
+        return np.nan
+
+    decay = 1.0 - 2.0 / (span + 1.0)
+    weights = decay ** np.arange(len(x) - 1, -1, -1, dtype=np.float64)
+    return weights @ x / weights.sum()
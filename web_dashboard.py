@@ -7,26 +7,131 @@
 import os
 import sys
 import json
+import argparse
 import asyncio
 import logging
-import yaml
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from flask import Flask, render_template, jsonify, request
 from flask_socketio import SocketIO, emit
 import threading
 import time
 import re
+import hashlib
+from collections import deque
 
 # 添加项目路径
 sys.path.append(os.path.join(os.path.dirname(__file__)))
 sys.path.append(os.path.join(os.path.dirname(__file__), 'python-binance-master/python-binance-master'))
 
+from trading_bot.config.config_manager import load_config_cached
 from trading_bot.data.futures_data import FuturesDataManager
 
+# 可选：orjson 加速 REST 接口与 WebSocket 推送的JSON序列化，未安装时使用标准库json
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """基于orjson的Flask JSON提供者（忽略indent等格式参数，始终输出紧凑JSON）"""
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS).decode()
+
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+    class _OrjsonShim:
+        """供python-socketio使用的json模块替身，dumps/loads接口与标准库一致"""
+
+        @staticmethod
+        def dumps(obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+
+        @staticmethod
+        def loads(s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+# 可选：Gunicorn 作为HTTP/WebSocket服务器，需通过 --gunicorn 显式启用，默认使用 socketio.run
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:
+    BaseApplication = None
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'trading_dashboard_secret_key'
-socketio = SocketIO(app, cors_allowed_origins="*")
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+    socketio = SocketIO(app, async_mode='threading', cors_allowed_origins="*", json=_OrjsonShim)
+else:
+    socketio = SocketIO(app, async_mode='threading', cors_allowed_origins="*")
+
+# AI输出解析：优先定位JSON中的 recommendations 数组直接解码，正则仅作兜底
+_RECOMMENDATIONS_KEY = '"recommendations"'
+_JSON_DECODER = json.JSONDecoder()
+_SIMPLE_RECOMMENDATION_RE = re.compile(
+    r'"symbol":\s*"([^"]*)".*?"action":\s*"([^"]*)".*?"confidence":\s*(\d+)',
+    re.DOTALL
+)
+# 捕获“最终交易判断:”后的内容块，直到下一个分隔线或下一段；非贪婪匹配，以分隔符或文件末尾为终止
+_FINAL_JUDGMENT_RE = re.compile(
+    r"最终交易判断:\s*[-=—_]*\s*(.+?)(?=\n\s*(?:=|-){3,}|\n\[\d{4}-\d{2}-\d{2}|\Z)",
+    re.DOTALL
+)
+
+
+def _first(d: Dict[str, Any], *keys: str, default: Any = 0.0) -> Any:
+    """按顺序返回第一个非None的键值（兼容数据管理器格式化键与Binance原始键）"""
+    for k in keys:
+        v = d.get(k)
+        if v is not None:
+            return v
+    return default
+
+
+# WebSocket增量推送中按内容摘要判断是否变化的数据段
+_DELTA_SECTIONS = ('account', 'market', 'ai_content')
+
+
+def _section_digest(piece: Any) -> bytes:
+    """计算数据段的内容摘要（忽略每次刷新都会变化的timestamp字段）"""
+    if isinstance(piece, dict) and 'timestamp' in piece:
+        piece = {k: v for k, v in piece.items() if k != 'timestamp'}
+    if orjson is not None:
+        raw = orjson.dumps(piece, default=str, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+    else:
+        raw = json.dumps(piece, default=str, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(raw, digest_size=8).digest()
+
+
+class CompatPosition(dict):
+    """持仓字典：只存储语义化键，按需把旧的Binance风格键映射到对应字段"""
+
+    _ALIAS = {
+        'positionAmt': 'amount',
+        'entryPrice': 'entry_price',
+        'markPrice': 'mark_price',
+        'unRealizedProfit': 'unrealized_pnl',
+        'positionSide': 'side',
+    }
+
+    def __missing__(self, key):
+        try:
+            return self[self._ALIAS[key]]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
 
 class TradingDashboard:
     """交易监控面板"""
@@ -40,10 +145,26 @@ class TradingDashboard:
         self._cached_account_data = {"error": "初始化中..."}
         self._cached_market_data = {"error": "初始化中..."}
         self._cached_ai_content = {"error": "初始化中..."}
+        # AI内容解析缓存：((output mtime_ns, size, think mtime_ns, size), 结果)
+        self._ai_cache: Optional[Tuple[Tuple[int, int, int, int], Dict[str, Any]]] = None
 
-        # 历史数据缓存
-        self.price_history = []
-        self.pnl_history = []
+        # 当前后台刷新周期的统一时间戳（同一周期内各数据共用）
+        self._current_tick_ts: Optional[str] = None
+
+        # 历史数据缓存（保持最近100个数据点）
+        self.price_history = deque(maxlen=100)
+        self.pnl_history = deque(maxlen=100)
+
+        # 刷新触发：后台循环在事件循环线程中等待，Flask/SocketIO线程通过 request_refresh 唤醒
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_request: Optional[asyncio.Event] = None
+        self._clients_connected = 0
+        self._clients_lock = threading.Lock()
+
+        # WebSocket增量推送：各数据段上次推送内容的摘要、上次推送的历史点与推送序号
+        self._last_emitted_hashes: Dict[str, Optional[bytes]] = dict.fromkeys(_DELTA_SECTIONS)
+        self._last_emitted_points: Dict[str, Any] = {'price': None, 'pnl': None}
+        self._emit_seq = 0
 
         # 文件路径
         self.history_file = "/home/xiaoqibpnm/bitbot/history.txt"
@@ -52,13 +173,22 @@ class TradingDashboard:
         self.output_file = "/home/xiaoqibpnm/bitbot/history/output.txt"
         # 报警文件路径
         self.alarm_file = os.path.join(os.path.dirname(__file__), 'alarm.txt')
+        # 报警读取缓存：((mtime_ns, size), 最近报警列表)
+        self._alerts_cache: Optional[Tuple[Tuple[int, int], List[str]]] = None
+
+        # 历史文件增量读取状态：{路径: {offset, ino, mtime_ns, remainder, entries}}
+        self._file_states: Dict[str, Dict[str, Any]] = {}
+        self._file_lock = threading.Lock()
+
+    def _tick_timestamp(self) -> str:
+        """返回当前刷新周期的时间戳，不在后台刷新周期内时取当前时间"""
+        return self._current_tick_ts or datetime.now().isoformat()
 
     def _load_config(self) -> Dict[str, Any]:
         """加载配置文件"""
         try:
             config_path = "trading_bot/config/config.yaml"
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return load_config_cached(config_path)
         except Exception as e:
             print(f"加载配置失败: {e}")
             return {}
@@ -100,11 +230,10 @@ class TradingDashboard:
             positions = await self.futures_data_manager.get_futures_positions()
 
             # 调试：记录原始数据
-            self.logger.info(f"原始持仓数据长度: {len(positions) if positions else 'None'}")
-            if positions:
-                for i, pos in enumerate(positions):
-                    if i < 3:  # 只记录前3个
-                        self.logger.info(f"持仓 {i}: {pos}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("原始持仓数据长度: %s", len(positions) if positions else 'None')
+                for i, pos in enumerate((positions or [])[:3]):  # 只记录前3个
+                    self.logger.debug("持仓 %d: %s", i, pos)
 
             # 计算总资产 - 兼容不同的字段名格式
             total_balance = float(account_info.get('total_wallet_balance',
@@ -122,60 +251,43 @@ class TradingDashboard:
             position_list = []
             total_position_value = 0
 
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
             for pos in positions:
                 # 兼容 FuturesDataManager 格式化后的键与 Binance 原始键
-                raw_amt = pos.get('positionAmt')
-                fmt_amt = pos.get('position_amount')
-                position_amt = float(fmt_amt if fmt_amt is not None else (raw_amt or 0))
-
-                self.logger.info(f"检查持仓: {pos.get('symbol', 'N/A')} - 数量: {position_amt}")
-
-                if position_amt != 0:
-                    raw_mark = pos.get('markPrice')
-                    fmt_mark = pos.get('mark_price')
-                    mark_price = float(fmt_mark if fmt_mark is not None else (raw_mark or 0))
-
-                    raw_entry = pos.get('entryPrice')
-                    fmt_entry = pos.get('entry_price')
-                    entry_price = float(fmt_entry if fmt_entry is not None else (raw_entry or 0))
-
-                    # unrealized PnL 兼容多种命名
-                    upnl_keys = [
-                        'unrealized_pnl', 'unRealizedPnL', 'unRealizedProfit', 'unrealizedProfit'
-                    ]
-                    upnl_val = 0.0
-                    for k in upnl_keys:
-                        if k in pos and pos[k] is not None:
-                            try:
-                                upnl_val = float(pos[k])
-                                break
-                            except Exception:
-                                pass
-
-                    position_value = abs(position_amt * mark_price)
-                    total_position_value += position_value
-
-                    self.logger.info(
-                        f"发现持仓: {pos.get('symbol', '')} - 数量: {position_amt}, 入场: {entry_price}, 价格: {mark_price}, PnL: {upnl_val}"
+                position_amt = float(_first(pos, 'position_amount', 'positionAmt') or 0)
+
+                if debug_enabled:
+                    self.logger.debug("检查持仓: %s - 数量: %s", pos.get('symbol', 'N/A'), position_amt)
+
+                if position_amt == 0:
+                    continue
+
+                mark_price = float(_first(pos, 'mark_price', 'markPrice') or 0)
+                entry_price = float(_first(pos, 'entry_price', 'entryPrice') or 0)
+                # unrealized PnL 兼容多种命名
+                upnl_val = float(_first(pos, 'unrealized_pnl', 'unRealizedPnL',
+                                        'unRealizedProfit', 'unrealizedProfit') or 0)
+
+                position_value = abs(position_amt * mark_price)
+                total_position_value += position_value
+
+                if debug_enabled:
+                    self.logger.debug(
+                        "发现持仓: %s - 数量: %s, 入场: %s, 价格: %s, PnL: %s",
+                        pos.get('symbol', ''), position_amt, entry_price, mark_price, upnl_val
                     )
 
-                    # 同时返回两套键，兼容现有前端模板与未来扩展
-                    position_list.append({
-                        # 现有前端模板期望的键名（Binance风格）
-                        'symbol': pos.get('symbol', ''),
-                        'positionAmt': position_amt,
-                        'entryPrice': entry_price,
-                        'markPrice': mark_price,
-                        'unRealizedProfit': upnl_val,
-                        'positionSide': pos.get('positionSide') or pos.get('position_side'),
-                        # 扩展键名（语义化）
-                        'amount': position_amt,
-                        'entry_price': entry_price,
-                        'mark_price': mark_price,
-                        'unrealized_pnl': upnl_val,
-                        'side': 'LONG' if position_amt > 0 else 'SHORT',
-                        'value': position_value
-                    })
+                # 只保留一套语义化键；旧键名通过 CompatPosition 别名访问
+                position_list.append(CompatPosition(
+                    symbol=pos.get('symbol', ''),
+                    amount=position_amt,
+                    entry_price=entry_price,
+                    mark_price=mark_price,
+                    unrealized_pnl=upnl_val,
+                    side='LONG' if position_amt > 0 else 'SHORT',
+                    value=position_value
+                ))
 
             return {
                 'total_balance': total_balance,
@@ -184,7 +296,7 @@ class TradingDashboard:
                 'positions': position_list,
                 'total_position_value': total_position_value,
                 'position_count': len(position_list),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._tick_timestamp()
             }
 
         except Exception as e:
@@ -200,10 +312,16 @@ class TradingDashboard:
             symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
             market_data = {}
 
+            # 不带symbol参数一次性获取全部合约ticker，在本地按币种筛选
+            all_tickers = await self.futures_data_manager.client.futures_ticker()
+            by_symbol = {t.get('symbol'): t for t in all_tickers}
+
             for symbol in symbols:
                 try:
-                    # 获取基础价格信息
-                    ticker = await self.futures_data_manager.client.futures_ticker(symbol=symbol)
+                    ticker = by_symbol.get(symbol)
+                    if ticker is None:
+                        raise ValueError(f"ticker中缺少{symbol}")
+                    # 基础价格信息
                     market_data[symbol] = {
                         "price": float(ticker.get('lastPrice', 0)),
                         "change": float(ticker.get('priceChangePercent', 0)),
@@ -217,15 +335,36 @@ class TradingDashboard:
 
             return {
                 'symbols': market_data,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._tick_timestamp()
             }
 
         except Exception as e:
             self.logger.error(f"获取市场数据失败: {e}")
             return {"error": str(e)}
 
+    def _ai_files_key(self) -> Optional[Tuple[int, int, int, int]]:
+        """输出文件与思考文件的 (mtime_ns, size)，任一文件不可访问时返回None"""
+        try:
+            out_st = os.stat(self.output_file)
+            think_st = os.stat(self.think_file)
+        except OSError:
+            return None
+        return (out_st.st_mtime_ns, out_st.st_size, think_st.st_mtime_ns, think_st.st_size)
+
     def get_ai_content(self) -> Dict[str, Any]:
-        """获取AI相关内容"""
+        """获取AI相关内容（文件未变化时直接返回上次解析结果）"""
+        key = self._ai_files_key()
+        cache = self._ai_cache
+        if key is not None and cache is not None and cache[0] == key:
+            return cache[1]
+
+        result = self._build_ai_content()
+        if key is not None and "error" not in result:
+            self._ai_cache = (key, result)
+        return result
+
+    def _build_ai_content(self) -> Dict[str, Any]:
+        """读取并解析AI思考与输出文件"""
         try:
             # 读取最新的AI思考内容
             think_content = self.read_file_content(self.think_file, 5)
@@ -251,30 +390,14 @@ class TradingDashboard:
                     # 合并所有输出内容来查找JSON
                     full_output = '\n'.join(output_content)
 
-                    # 查找recommendations部分 - 更新的正则表达式
-                    if '"recommendations"' in full_output:
-                        import re
-                        import json
-
-                        # 尝试提取每个recommendation对象
-                        pattern = r'\{\s*"symbol":\s*"([^"]*)"[^}]*"action":\s*"([^"]*)"[^}]*"confidence":\s*(\d+)[^}]*"entry_price":\s*([0-9.]+)[^}]*"leverage":\s*(\d+)[^}]*"reason":\s*"([^"]*)"[^}]*\}'
-                        matches = re.findall(pattern, full_output, re.DOTALL)
-
-                        for match in matches:
-                            latest_decisions.append({
-                                'symbol': match[0],
-                                'action': match[1],
-                                'confidence': int(match[2]),
-                                'entry_price': float(match[3]),
-                                'leverage': int(match[4]),
-                                # 展示完整理由
-                                'reason': match[5]
-                            })
-
-                        # 如果正则没匹配到，尝试简化的匹配
+                    # 查找recommendations部分
+                    if _RECOMMENDATIONS_KEY in full_output:
+                        # 从末尾向前解析JSON数组，结果已按从新到旧排序
+                        latest_decisions = self._parse_latest_recommendations(full_output, 5)
+
+                        # 如果JSON解析失败，尝试简化的正则匹配
                         if not latest_decisions:
-                            simple_pattern = r'"symbol":\s*"([^"]*)".*?"action":\s*"([^"]*)".*?"confidence":\s*(\d+)'
-                            simple_matches = re.findall(simple_pattern, full_output, re.DOTALL)
+                            simple_matches = _SIMPLE_RECOMMENDATION_RE.findall(full_output)
                             for match in simple_matches:
                                 latest_decisions.append({
                                     'symbol': match[0],
@@ -285,8 +408,7 @@ class TradingDashboard:
                                     'reason': "详见完整分析"
                                 })
 
-                        # 仅保留最新5条，并按从新到旧排序
-                        if latest_decisions:
+                            # 仅保留最新5条，并按从新到旧排序
                             latest_decisions = latest_decisions[-5:][::-1]
 
                 except Exception as e:
@@ -295,21 +417,7 @@ class TradingDashboard:
             # 解析think.txt中的“最终交易判断”最近5条
             final_judgments: List[str] = []
             try:
-                if os.path.exists(self.think_file):
-                    with open(self.think_file, 'r', encoding='utf-8') as tf:
-                        think_text = tf.read()
-                    # 捕获“最终交易判断:”后的内容块，直到下一个分隔线或下一段
-                    # 使用非贪婪匹配，并以分隔符或文件末尾为终止
-                    fj_pattern = r"最终交易判断:\s*[-=—_]*\s*(.+?)(?=\n\s*(?:=|-){3,}|\n\[\d{4}-\d{2}-\d{2}|\Z)"
-                    blocks = re.findall(fj_pattern, think_text, re.DOTALL)
-                    # 清洗并提取最后5条
-                    cleaned: List[str] = []
-                    for b in blocks:
-                        s = b.strip()
-                        if s:
-                            cleaned.append(s)
-                    if cleaned:
-                        final_judgments = cleaned[-5:][::-1]  # 最新在前
+                final_judgments = self.read_final_judgments(5)
             except Exception as e:
                 self.logger.warning(f"解析最终交易判断失败: {e}")
 
@@ -318,38 +426,195 @@ class TradingDashboard:
                 "latest_decisions": latest_decisions,
                 "decisions_count": len(latest_decisions),
                 "final_judgments": final_judgments,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": self._tick_timestamp()
             }
 
         except Exception as e:
             self.logger.error(f"获取AI内容失败: {e}")
             return {"error": str(e)}
 
+    def _parse_latest_recommendations(self, text: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """从文本末尾向前定位 "recommendations": [...] 数组并解码，返回最新的若干条决策（从新到旧）"""
+        decisions: List[Dict[str, Any]] = []
+        end = len(text)
+
+        while len(decisions) < limit:
+            key_idx = text.rfind(_RECOMMENDATIONS_KEY, 0, end)
+            if key_idx < 0:
+                break
+            end = key_idx
+
+            # 键后应紧跟冒号与数组起始
+            value_start = text.find('[', key_idx + len(_RECOMMENDATIONS_KEY))
+            if value_start < 0 or text[key_idx + len(_RECOMMENDATIONS_KEY):value_start].strip() != ':':
+                continue
+            try:
+                recs, _ = _JSON_DECODER.raw_decode(text, value_start)
+            except ValueError:
+                continue
+
+            for rec in reversed(recs):
+                if not isinstance(rec, dict) or not rec.get('symbol') or not rec.get('action'):
+                    continue
+                try:
+                    decisions.append({
+                        'symbol': rec['symbol'],
+                        'action': rec['action'],
+                        'confidence': int(float(rec.get('confidence') or 0)),
+                        'entry_price': float(rec.get('entry_price') or 0),
+                        'leverage': int(float(rec.get('leverage') or 1)),
+                        # 展示完整理由
+                        'reason': rec.get('reason') or "详见完整分析"
+                    })
+                except (TypeError, ValueError):
+                    continue
+                if len(decisions) >= limit:
+                    break
+
+        return decisions
+
     def read_file_content(self, file_path: str, max_entries: int = 5) -> List[str]:
-        """读取文件内容"""
+        """读取文件内容（增量读取）
+
+        历史文件只追加写入，因此只读取上次偏移之后新增的字节；文件被截断或替换时从头重读。
+        最后一个未以空行结束的段落暂存为 remainder，与下次新增内容拼接后再切分。
+        """
         try:
             if not os.path.exists(file_path):
                 return []
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-
-            if not content:
-                return []
-
-            # 按段落分割
-            entries = [entry.strip() for entry in content.split('\n\n') if entry.strip()]
+            with self._file_lock:
+                st = os.stat(file_path)
+                state = self._file_states.get(file_path)
+                if (state is None or st.st_size < state['offset'] or st.st_ino != state['ino']
+                        or state['entries'].maxlen < max_entries * 4):
+                    state = {
+                        'offset': 0,
+                        'ino': st.st_ino,
+                        'mtime_ns': None,
+                        'remainder': b'',
+                        'entries': deque(maxlen=max_entries * 4)
+                    }
+                    self._file_states[file_path] = state
+
+                if state['mtime_ns'] != st.st_mtime_ns or state['offset'] != st.st_size:
+                    with open(file_path, 'rb') as f:
+                        f.seek(state['offset'])
+                        delta = f.read()
+                    state['offset'] += len(delta)
+                    state['mtime_ns'] = st.st_mtime_ns
+
+                    # 按段落分割（在字节层面切分，'\n' 不会出现在UTF-8多字节字符中）
+                    chunks = (state['remainder'] + delta).split(b'\n\n')
+                    state['remainder'] = chunks.pop()
+                    for chunk in chunks:
+                        entry = chunk.decode('utf-8', errors='replace').strip()
+                        if entry:
+                            state['entries'].append(entry)
+
+                entries = list(state['entries'])
+                tail = state['remainder'].decode('utf-8', errors='replace').strip()
+
+            if tail:
+                entries.append(tail)
             return entries[-max_entries:] if entries else []
 
         except Exception as e:
             self.logger.error(f"读取文件{file_path}失败: {e}")
             return []
 
+    def read_alerts(self, limit: int = 50) -> List[str]:
+        """读取报警文件末尾最近的若干条报警（只读取文件尾部64KB，按mtime与大小缓存）"""
+        try:
+            st = os.stat(self.alarm_file)
+        except FileNotFoundError:
+            return []
+
+        key = (st.st_mtime_ns, st.st_size)
+        cache = self._alerts_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
+        with open(self.alarm_file, 'rb') as f:
+            start = max(0, st.st_size - 64 * 1024)
+            f.seek(start)
+            tail = f.read().decode('utf-8', 'replace')
+        lines = tail.splitlines()
+        if start > 0 and lines:
+            lines = lines[1:]  # 丢弃被截断的首行
+
+        alerts = [line.strip() for line in lines[-limit:] if line.strip()]
+        self._alerts_cache = (key, alerts)
+        return alerts
+
+    def read_final_judgments(self, limit: int = 5) -> List[str]:
+        """从think.txt尾部解析最近的若干条“最终交易判断”（最新在前）
+
+        先读取文件尾部64KB，不足limit条且未读到文件开头时窗口加倍，不再整文件读取。
+        判断内容块从标记处向后匹配，窗口起点截断的块因缺少标记不会被误匹配。
+        """
+        try:
+            size = os.stat(self.think_file).st_size
+        except FileNotFoundError:
+            return []
+
+        window = 64 * 1024
+        with open(self.think_file, 'rb') as f:
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                text = f.read(size - start).decode('utf-8', 'replace')
+                blocks = [b.strip() for b in _FINAL_JUDGMENT_RE.findall(text)]
+                blocks = [b for b in blocks if b]
+                if len(blocks) >= limit or start == 0:
+                    break
+                window *= 2
+
+        return blocks[-limit:][::-1]
+
+    def request_refresh(self):
+        """从任意线程唤醒后台更新循环，立即执行一次刷新"""
+        if self._loop and self._refresh_request:
+            self._loop.call_soon_threadsafe(self._refresh_request.set)
+
+    def client_connected(self):
+        """记录WebSocket客户端连接，并触发即时刷新（下一次推送为完整数据）"""
+        with self._clients_lock:
+            self._clients_connected += 1
+        self._last_emitted_hashes = dict.fromkeys(_DELTA_SECTIONS)
+        self.request_refresh()
+
+    def client_disconnected(self):
+        """记录WebSocket客户端断开"""
+        with self._clients_lock:
+            self._clients_connected = max(0, self._clients_connected - 1)
+
+    def build_update_payload(self, account_data: Dict[str, Any], market_data: Dict[str, Any],
+                             ai_content: Dict[str, Any]) -> Dict[str, Any]:
+        """构造WebSocket增量推送：仅包含内容有变化的数据段与最新的历史点，附带递增序号"""
+        self._emit_seq += 1
+        payload: Dict[str, Any] = {'seq': self._emit_seq}
+
+        hashes = self._last_emitted_hashes
+        for name, piece in zip(_DELTA_SECTIONS, (account_data, market_data, ai_content)):
+            digest = _section_digest(piece)
+            if digest != hashes.get(name):
+                hashes[name] = digest
+                payload[name] = piece
+
+        for name, history in (('price', self.price_history), ('pnl', self.pnl_history)):
+            latest = history[-1] if history else None
+            if latest is not None and latest is not self._last_emitted_points[name]:
+                self._last_emitted_points[name] = latest
+                payload[f'{name}_point'] = latest
+
+        return payload
+
     def update_price_history(self, market_data: Dict[str, Any]):
         """更新价格历史"""
         try:
             if 'symbols' in market_data:
-                timestamp = datetime.now().isoformat()
+                timestamp = self._tick_timestamp()
                 price_point = {'timestamp': timestamp}
 
                 for symbol, data in market_data['symbols'].items():
@@ -357,9 +622,6 @@ class TradingDashboard:
                         price_point[symbol] = data['price']
 
                 self.price_history.append(price_point)
-                # 保持最近100个数据点
-                if len(self.price_history) > 100:
-                    self.price_history = self.price_history[-100:]
         except Exception as e:
             self.logger.error(f"更新价格历史失败: {e}")
 
@@ -367,7 +629,7 @@ class TradingDashboard:
         """更新盈亏历史"""
         try:
             if 'total_balance' in account_data and 'unrealized_pnl' in account_data:
-                timestamp = datetime.now().isoformat()
+                timestamp = self._tick_timestamp()
                 pnl_point = {
                     'timestamp': timestamp,
                     'total_balance': account_data['total_balance'],
@@ -375,9 +637,6 @@ class TradingDashboard:
                 }
 
                 self.pnl_history.append(pnl_point)
-                # 保持最近100个数据点
-                if len(self.pnl_history) > 100:
-                    self.pnl_history = self.pnl_history[-100:]
         except Exception as e:
             self.logger.error(f"更新盈亏历史失败: {e}")
 
@@ -410,8 +669,7 @@ def api_market():
 def api_ai_content():
     """AI内容API"""
     try:
-        ai_content = dashboard.get_ai_content()
-        return jsonify(ai_content)
+        return jsonify(dashboard._cached_ai_content)
     except Exception as e:
         return jsonify({"error": f"获取AI内容失败: {str(e)}"})
 
@@ -419,7 +677,7 @@ def api_ai_content():
 def api_price_history():
     """价格历史API"""
     try:
-        return jsonify(dashboard.price_history[-50:])  # 最近50个数据点
+        return jsonify(list(dashboard.price_history)[-50:])  # 最近50个数据点
     except Exception as e:
         return jsonify({"error": f"获取价格历史失败: {str(e)}"})
 
@@ -427,21 +685,15 @@ def api_price_history():
 def api_pnl_history():
     """盈亏历史API"""
     try:
-        return jsonify(dashboard.pnl_history[-50:])  # 最近50个数据点
+        return jsonify(list(dashboard.pnl_history)[-50:])  # 最近50个数据点
     except Exception as e:
         return jsonify({"error": f"获取盈亏历史失败: {str(e)}"})
 
 @app.route('/api/alerts')
 def api_alerts():
     try:
-        alarm_path = os.path.join(os.path.dirname(__file__), 'alarm.txt')
-        if not os.path.exists(alarm_path):
-            return jsonify([])
         # 读取末尾最近50条
-        with open(alarm_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()[-50:]
-        alerts = [line.strip() for line in lines if line.strip()]
-        return jsonify(alerts)
+        return jsonify(dashboard.read_alerts(50))
     except Exception as e:
         return jsonify({"error": f"获取报警失败: {str(e)}"})
 
@@ -450,49 +702,118 @@ def api_alerts():
 def handle_connect():
     """WebSocket连接处理"""
     print('客户端已连接')
+    dashboard.client_connected()
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """WebSocket断开处理"""
     print('客户端已断开')
+    dashboard.client_disconnected()
 
 async def background_update_async():
-    """异步后台更新任务"""
+    """异步后台更新任务
+
+    每30秒刷新一次，新客户端连接时立即刷新；无客户端连接时跳过拉取，避免空转请求Binance。
+    """
+    dashboard._loop = asyncio.get_running_loop()
+    dashboard._refresh_request = asyncio.Event()
+    has_data = False
+
     while True:
         try:
-            # 获取最新数据
-            account_data = await dashboard.get_account_summary()
-            market_data = await dashboard.get_market_data()
-            ai_content = dashboard.get_ai_content()
-
-            # 缓存数据
-            dashboard._cached_account_data = account_data
-            dashboard._cached_market_data = market_data
-            dashboard._cached_ai_content = ai_content
-
-            # 更新历史数据
-            dashboard.update_pnl_history(account_data)
-            dashboard.update_price_history(market_data)
-
-            # 通过WebSocket发送更新
-            socketio.emit('data_update', {
-                'account': account_data,
-                'market': market_data,
-                'ai_content': ai_content,
-                'price_history': dashboard.price_history[-20:],
-                'pnl_history': dashboard.pnl_history[-20:]
-            })
-
-            # 等待30秒
-            await asyncio.sleep(30)
+            # 无客户端连接时跳过（首次仍拉取一次，保证REST接口有缓存可用）
+            if dashboard._clients_connected > 0 or not has_data:
+                # 本周期所有数据与历史点共用同一时间戳
+                dashboard._current_tick_ts = datetime.now().isoformat()
+
+                # 获取最新数据
+                account_data = await dashboard.get_account_summary()
+                market_data = await dashboard.get_market_data()
+                # 文件读取为阻塞操作，放到线程池执行，避免阻塞事件循环
+                ai_content = await asyncio.get_running_loop().run_in_executor(None, dashboard.get_ai_content)
+
+                # 缓存数据
+                dashboard._cached_account_data = account_data
+                dashboard._cached_market_data = market_data
+                dashboard._cached_ai_content = ai_content
+                has_data = True
+
+                # 更新历史数据
+                dashboard.update_pnl_history(account_data)
+                dashboard.update_price_history(market_data)
+
+                # 通过WebSocket发送增量更新（未变化的数据段不重复发送）
+                socketio.emit('data_update', dashboard.build_update_payload(
+                    account_data, market_data, ai_content
+                ))
+                dashboard._current_tick_ts = None
+
+            # 等待30秒，或被新连接提前唤醒
+            try:
+                await asyncio.wait_for(dashboard._refresh_request.wait(), timeout=30)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                dashboard._refresh_request.clear()
 
         except Exception as e:
             dashboard.logger.error(f"后台更新失败: {e}")
             await asyncio.sleep(60)  # 出错时等待更长时间
 
 def run_flask():
-    """运行Flask应用"""
-    socketio.run(app, host='0.0.0.0', port=5001, debug=False, allow_unsafe_werkzeug=True)
+    """运行Flask应用（Werkzeug线程服务器）"""
+    socketio.run(app, host='0.0.0.0', port=5001, debug=False, use_reloader=False,
+                 allow_unsafe_werkzeug=True)
+
+if BaseApplication is not None:
+    class DashboardApplication(BaseApplication):
+        """以编程方式启动的Gunicorn应用"""
+
+        def __init__(self, application, options: Optional[Dict[str, Any]] = None):
+            self.options = options or {}
+            self.application = application
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key.lower(), value)
+
+        def load(self):
+            return self.application
+
+
+async def _background_main():
+    """初始化数据管理器并运行后台更新任务"""
+    success = await dashboard.initialize()
+    if not success:
+        print("❌ 初始化失败，后台更新任务未启动")
+        return
+
+    print("✅ 监控面板初始化成功")
+    await background_update_async()
+
+def _start_background_thread(worker=None):
+    """在独立线程中运行后台更新任务（Gunicorn worker 初始化完成后调用）"""
+    threading.Thread(target=lambda: asyncio.run(_background_main()), daemon=True).start()
+
+def run_gunicorn():
+    """通过Gunicorn运行Web服务
+
+    缓存与历史数据保存在进程内的全局 dashboard 中，因此只使用单个worker进程，
+    后台更新任务在该worker内启动，与HTTP/WebSocket处理共享同一份数据。
+    """
+    options = {
+        'bind': '0.0.0.0:5001',
+        'workers': 1,
+        'worker_class': 'gthread',
+        'threads': 8,
+        'keepalive': 75,
+        'post_worker_init': _start_background_thread,
+    }
+    print("🌐 Web服务器(Gunicorn)启动中")
+    print("📱 访问地址: http://localhost:5001")
+    DashboardApplication(app, options).run()
 
 async def main():
     """主函数"""
@@ -515,7 +836,17 @@ async def main():
     await background_update_async()
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='实时交易监控Web界面')
+    parser.add_argument('--gunicorn', action='store_true',
+                        help='使用Gunicorn(gthread)作为Web服务器（需已安装gunicorn）')
+    args = parser.parse_args()
+    if args.gunicorn and BaseApplication is None:
+        parser.error("未安装gunicorn，请先执行: pip install gunicorn")
+
     try:
-        asyncio.run(main())
+        if args.gunicorn:
+            run_gunicorn()
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\n⏹️  监控面板已停止")